@@ -5,20 +5,67 @@ Scrapes startup data from C14.so database
 
 import asyncio
 import aiohttp
+import csv
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser
 import logging
 import re
+import os
 import time
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import urljoin, urlparse, urlunparse, parse_qs
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Dict, Iterable, List, Optional, Tuple
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Patterns used on every page, compiled once
+UUID_HREF_RE = re.compile(r'^[a-f0-9-]{36}$')
+YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+NUMBER_RE = re.compile(r'\d+')
+NON_NUM_RE = re.compile(r'[^\d.,]')
+TRACKING_PARAM_RE = re.compile(r'(?<=[?&])utm_(?:source|medium|campaign|term|content)(?:=[^&#]*)?(?:&|(?=#)|$)')
+DANGLING_SEPARATOR_RE = re.compile(r'[?&](?=#|$)')
+
+# Equivalent of BeautifulSoup's class_=re.compile(r'tag|category|sector') on span/div/a
+SECTOR_FALLBACK_SELECTOR = ', '.join(
+    f'{tag}[class*="{keyword}"]' for tag in ('span', 'div', 'a') for keyword in ('tag', 'category', 'sector')
+)
+
+# Listing pages are fed to the pull parser in chunks of this many bytes
+LISTING_CHUNK_SIZE = 64 * 1024
+
+# Column order expected by the CSV importer for each entity/relationship file
+STARTUP_CSV_FIELDS = (
+    'name', 'description', 'website', 'founded_year', 'stage', 'sector', 'business_model',
+    'headquarters', 'employee_count', 'status', 'total_funding', 'last_funding_date',
+    'exit_date', 'exit_value'
+)
+PERSON_CSV_FIELDS = (
+    'name', 'surname', 'role_type', 'linkedin_url', 'twitter_handle', 'biography', 'location',
+    'birth_year', 'education', 'previous_experience', 'specialization', 'reputation_score'
+)
+INVESTOR_CSV_FIELDS = (
+    'name', 'description', 'website', 'founded_year', 'headquarters', 'type', 'investment_focus',
+    'stage_focus', 'geographic_focus', 'team_size', 'assets_under_management', 'portfolio_companies_count'
+)
+FOUNDING_RELATIONSHIP_CSV_FIELDS = (
+    'person_name', 'person_surname', 'startup_name', 'role', 'founding_date', 'equity_percentage',
+    'is_current', 'exit_date'
+)
+INVESTMENT_RELATIONSHIP_CSV_FIELDS = (
+    'investor_name', 'investor_type', 'startup_name', 'round_stage', 'round_date', 'amount',
+    'valuation_pre', 'valuation_post', 'is_lead_investor', 'board_seats', 'equity_percentage'
+)
+
+@dataclass(slots=True)  # no per-instance __dict__ (Python 3.10+)
 class StartupData:
     """Data structure for startup information from C14"""
     name: str
@@ -77,52 +124,196 @@ class InvestorData:
 
 def clean_url(url: str) -> str:
     """Remove UTM parameters and other tracking parameters from URL"""
-    if not url:
+    if not url or 'utm_' not in url:
         return url
     
+    # Strip each tracking parameter together with the separator that follows it,
+    # then drop a "?" or "&" left dangling before the fragment or end of the URL
+    cleaned = TRACKING_PARAM_RE.sub('', url)
+    return DANGLING_SEPARATOR_RE.sub('', cleaned)
+
+def normalize_whitespace(text: str) -> str:
+    """Remove line breaks and collapse runs of whitespace into single spaces"""
+    # split()/join() is one C-level pass each and beats re.sub(r'\s+', ' ', text).strip() on short texts
+    return ' '.join(text.split())
+
+def _retry_after_seconds(headers) -> Optional[float]:
+    """Parse how long the server asks us to wait, from Retry-After or X-RateLimit-Reset"""
+    value = headers.get('Retry-After')
+    if value is None:
+        value = headers.get('X-RateLimit-Reset')
     try:
-        parsed = urlparse(url)
-        # Parse query parameters
-        query_params = parse_qs(parsed.query)
-        
-        # Remove UTM and tracking parameters
-        tracking_params = ['utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content']
-        for param in tracking_params:
-            query_params.pop(param, None)
-        
-        # Rebuild query string
-        if query_params:
-            # Flatten the query params (parse_qs returns lists)
-            clean_params = []
-            for key, values in query_params.items():
-                for value in values:
-                    clean_params.append(f"{key}={value}")
-            clean_query = "&".join(clean_params)
-        else:
-            clean_query = ""
-        
-        # Rebuild the URL
-        clean_parsed = parsed._replace(query=clean_query)
-        return urlunparse(clean_parsed)
+        seconds = float(value) if value is not None else None
+    except ValueError:
+        return None
+    if seconds is None:
+        return None
+    # X-RateLimit-Reset is often an epoch timestamp rather than a delay
+    if seconds > 1e9:
+        seconds -= time.time()
+    return max(seconds, 0.0)
+
+@lru_cache(maxsize=1024)
+def _extract_year(date_str: str) -> Optional[int]:
+    """Extract year from date string"""
+    if not date_str:
+        return None
     
-    except Exception as e:
-        logger.warning(f"Error cleaning URL {url}: {e}")
-        return url
+    # Look for 4-digit year
+    year_match = YEAR_RE.search(date_str)
+    if year_match:
+        return int(year_match.group())
+    return None
+
+@lru_cache(maxsize=1024)
+def _extract_employee_count(team_size_str: str) -> Optional[int]:
+    """Extract employee count from team size string"""
+    if not team_size_str:
+        return None
+    
+    # Handle ranges like "501-1000"
+    if '-' in team_size_str:
+        parts = team_size_str.split('-')
+        try:
+            # Return the midpoint of the range
+            min_val = int(parts[0])
+            max_val = int(parts[1])
+            return (min_val + max_val) // 2
+        except:
+            pass
+    
+    # Extract single number
+    number_match = NUMBER_RE.search(team_size_str)
+    if number_match:
+        return int(number_match.group())
+    
+    return None
+
+@lru_cache(maxsize=1024)
+def _extract_funding_amount(amount_str: str) -> Optional[float]:
+    """Extract funding amount from amount string"""
+    if not amount_str:
+        return None
+    
+    # Remove currency symbols and convert to float
+    amount_clean = NON_NUM_RE.sub('', amount_str)
+    if not amount_clean:
+        return None
+    
+    try:
+        # Handle different decimal separators
+        amount_clean = amount_clean.replace(',', '.')
+        return float(amount_clean)
+    except:
+        return None
+
+class AsyncTokenBucket:
+    """Token bucket rate limiter shared by all concurrent requests"""
+    
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate  # Tokens added per second
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    def pause(self, seconds: float):
+        """Stop handing out tokens for the given time (e.g. after a Retry-After)"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+        self._last = self._paused_until
+    
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                if self.rate == float('inf'):
+                    return
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
 
 class C14Scraper:
     """Scraper for C14.so Italian startup database"""
     
-    def __init__(self, delay: float = 1.0):
+    # Selectors used on every detail page, defined once (Lexbor takes selectors as strings)
+    # Main content column of a startup page; scans are scoped to it when it is present
+    CONTENT_ROOT_SELECTOR = '.mb-0'
+    DESCRIPTION_SELECTOR = '.prose > p:nth-child(1)'
+    SECTORS_SELECTOR = 'div.gap-1:nth-child(3)'
+    FOUNDERS_SELECTOR = '.mb-0 > div:nth-child(7) > div:nth-child(2) > div:nth-child(2)'
+    INVESTORS_SELECTOR = '.mb-0 > div:nth-child(8) > div:nth-child(2) > div:nth-child(2)'
+    # Same containers as div:nth-child() steps below the content root
+    FOUNDERS_PATH = (7, 2, 2)
+    INVESTORS_PATH = (8, 2, 2)
+    # LinkedIn cards of founders/investors: name and role are the first two <p> of the card
+    LINKEDIN_LINK_SELECTOR = 'a[href*="linkedin.com"]'
+    PERSON_PARAGRAPHS_SELECTOR = 'div > div > p'
+    # Label/value rows of the company info panel: each row is a div holding two <p> (label, value)
+    INFO_SELECTOR = 'div.border-default > div'
+    # Label keyword -> StartupData field
+    INFO_FIELDS = (
+        ('team size', 'team_size'),
+        ('location', 'location'),
+        ('foundation', 'foundation_date'),
+        ('funding stage', 'funding_stage'),
+        ('amount raised', 'amount_raised'),
+    )
+    INFO_FIELD_BY_KEYWORD = dict(INFO_FIELDS)
+    # All label keywords in one alternation: a single scan per label instead of one per keyword
+    INFO_LABEL_RE = re.compile('|'.join(re.escape(keyword) for keyword, _ in INFO_FIELDS), re.IGNORECASE)
+    
+    # Seconds a cached response stays fresh when the server gives no caching headers
+    CACHE_EXPIRE_AFTER = 86400
+    
+    def __init__(self, delay: float = 1.0, cache_name: Optional[str] = None):
         self.base_url = "https://www.c14.so"
         self.delay = delay  # Rate limiting
-        self.session = requests.Session()
+        self.cache_name = cache_name
+        if cache_name:
+            # Persist responses on disk and revalidate with ETag/Last-Modified, so
+            # unchanged pages come back as 304s on re-runs
+            import requests_cache
+            self.session = requests_cache.CachedSession(
+                cache_name, backend='sqlite', cache_control=True, expire_after=self.CACHE_EXPIRE_AFTER
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Connection': 'keep-alive',
+            # Only advertise encodings urllib3 can actually decode (br needs brotli installed)
+            **make_headers(accept_encoding=True)
         })
         
+        # Single host crawl: keep a warm pool of connections and retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Collections for people and relationships
-        self.all_founders = []
-        self.all_investors = []
+        # Founders and investors keyed by name, so duplicates are dropped on insert
+        self.all_founders: Dict[str, Dict] = {}
+        self.all_investors: Dict[str, Dict] = {}
         self.founding_relationships = []
         self.investment_relationships = []
         
@@ -133,6 +324,8 @@ class C14Scraper:
         """
         startup_links = []
         page = 1
+        # Startup hrefs are bare UUIDs (see UUID_HREF_RE), so they only need the site prefix
+        detail_base = self.base_url.rstrip('/') + '/'
         
         while True:
             if max_pages and page > max_pages:
@@ -145,37 +338,36 @@ class C14Scraper:
             logger.info(f"Scraping page {page}: {url}")
             
             try:
-                response = self.session.get(url)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find startup links - they follow the pattern href="uuid"
-                startup_elements = soup.find_all('a', href=re.compile(r'^[a-f0-9-]{36}$'))
+                # Stream the page through lxml and keep only startup anchors - they follow
+                # the pattern href="uuid"; each anchor is cleared once it has been read.
+                # The decompressed body is fed chunk by chunk and never held as one bytes object
+                parser = etree.HTMLPullParser(events=('end',), tag='a', encoding='utf-8')
+                startup_elements = []
+                with self.session.get(url, stream=True) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(chunk_size=LISTING_CHUNK_SIZE):
+                        parser.feed(chunk)
+                        self._collect_startup_anchors(parser, startup_elements)
+                parser.close()
+                self._collect_startup_anchors(parser, startup_elements)
                 
                 if not startup_elements:
                     logger.info(f"No more startups found on page {page}")
                     break
                 
-                for element in startup_elements:
+                for href, text_content in startup_elements:
                     try:
-                        href = element.get('href')
-                        if not href:
-                            continue
-                            
-                        full_url = urljoin(self.base_url, href)
+                        full_url = detail_base + href
                         
                         # Extract name and description from the link text
-                        text_content = element.get_text(strip=True)
                         if not text_content:
                             continue
                         
                         # Split name and description (usually "Name Description" format)
-                        parts = text_content.split(' ', 1)
-                        name = parts[0] if parts else ""
-                        description = parts[1] if len(parts) > 1 else ""
+                        name, _, description = text_content.partition(' ')
                         
                         # Extract UUID from URL
-                        uuid = href.split('/')[-1]
+                        uuid = href.rpartition('/')[2]
                         
                         startup_links.append((name, description, full_url, uuid))
                         
@@ -194,218 +386,285 @@ class C14Scraper:
         logger.info(f"Total startup links found: {len(startup_links)}")
         return startup_links
     
+    @staticmethod
+    def _collect_startup_anchors(parser: etree.HTMLPullParser, startup_elements: List[Tuple[str, str]]):
+        """Drain the pull parser, keeping (href, text) for anchors that point to a startup"""
+        for _, element in parser.read_events():
+            href = element.get('href', '')
+            if UUID_HREF_RE.match(href):
+                # Same text as BeautifulSoup's get_text(strip=True)
+                startup_elements.append((href, ''.join(part.strip() for part in element.itertext())))
+            element.clear()
+    
     def scrape_startup_details(self, url: str, uuid: str) -> Optional[StartupData]:
         """
         Scrape detailed information from a startup page
         """
+        startup_data = self._parse_detail_page(self._fetch_detail_html(url), url, uuid)
+        if startup_data:
+            self._record_people(startup_data)
+        return startup_data
+    
+    def _fetch_detail_html(self, url: str) -> Optional[str]:
+        """Download a startup page, returning None on failure"""
         try:
             response = self.session.get(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract basic info
-            name = ""
-            description = ""
-            website = ""
-            linkedin = ""
-            logo_url = ""
-            
-            # Name (usually in h1)
-            h1_element = soup.find('h1')
-            if h1_element:
-                name = h1_element.get_text(strip=True)
-            
-            # Logo
-            img_element = soup.find('img', alt=name)
-            if img_element:
-                logo_url = img_element.get('src', '')
-            
-            # Description using the correct CSS selector
-            desc_element = soup.select_one('.prose > p:nth-child(1)')
-            if desc_element:
-                description = desc_element.get_text(strip=True)
-                # Remove line breaks and normalize whitespace
-                description = ' '.join(description.split())
-            else:
-                # Fallback to previous method
-                desc_candidates = soup.find_all(['p', 'div'], string=re.compile(r'.{20,}'))
-                for candidate in desc_candidates:
-                    text = candidate.get_text(strip=True)
-                    # Remove line breaks and normalize whitespace
-                    text = ' '.join(text.split())
+            # C14 serves UTF-8: decode directly instead of relying on header/charset guessing
+            return response.content.decode('utf-8', errors='replace')
+        except Exception as e:
+            logger.error(f"Error scraping startup details from {url}: {e}")
+            return None
+    
+    @classmethod
+    def _parse_detail_page(cls, html: Optional[str], url: str, uuid: str) -> Optional[StartupData]:
+        """Parse a downloaded startup page, returning None on failure (picklable for process pools)"""
+        if html is None:
+            return None
+        try:
+            return cls.parse_startup_details(html, url, uuid)
+        except Exception as e:
+            logger.error(f"Error scraping startup details from {url}: {e}")
+            return None
+    
+    @classmethod
+    def parse_startup_details(cls, html: str, url: str, uuid: str) -> StartupData:
+        """
+        Parse a startup page into StartupData.
+        Pure function of the HTML so it can run in a worker process.
+        """
+        tree = LexborHTMLParser(html)
+        # Scan the main content column first and only widen to the whole page if it has nothing
+        content_root = tree.css_first(cls.CONTENT_ROOT_SELECTOR)
+        search_roots = (content_root, tree.root) if content_root else (tree.root,)
+        
+        # Extract basic info
+        name = ""
+        description = ""
+        website = ""
+        linkedin = ""
+        logo_url = ""
+        
+        # Name (usually in h1)
+        h1_element = tree.css_first('h1')
+        if h1_element:
+            name = h1_element.text(strip=True)
+        
+        # Logo
+        for img_element in tree.css('img[alt]'):
+            if img_element.attributes.get('alt') == name:
+                logo_url = img_element.attributes.get('src') or ''
+                break
+        
+        # Description using the correct CSS selector
+        desc_element = tree.css_first(cls.DESCRIPTION_SELECTOR)
+        if desc_element:
+            description = normalize_whitespace(desc_element.text(strip=True))
+        
+        if not description:
+            # Fallback to previous method: first p/div whose own text is long enough
+            for root in search_roots:
+                for candidate in root.css('p, div'):
+                    own_text = candidate.text(deep=False)
+                    # Raw length bounds the normalized length, so short nodes are skipped unprocessed
+                    if len(own_text) <= 20:
+                        continue
+                    text = normalize_whitespace(own_text)
                     if len(text) > 20 and not text.startswith('http'):
                         description = text
                         break
+                if description:
+                    break
+        
+        # Links (website, linkedin) - the last match wins, so only that href gets cleaned
+        links = tree.css('a[href]')
+        for link in links:
+            href = link.attributes.get('href') or ''
+            text_low = link.text(strip=True).lower()
             
-            # Links (website, linkedin)
-            links = soup.find_all('a', href=True)
-            for link in links:
-                href = link.get('href', '')
-                text = link.get_text(strip=True).lower()
-                
-                if 'visit website' in text or 'website' in text:
-                    website = clean_url(href)
-                elif 'linkedin' in text or 'linkedin.com' in href:
-                    linkedin = clean_url(href)
-            
-            # Company details using label-based approach for better reliability
-            location = ""
-            foundation_date = ""
-            team_size = ""
-            funding_stage = ""
-            amount_raised = ""
-            
-            # Find all div.border-default elements
-            border_divs = soup.select('div.border-default')
-            
-            for div in border_divs:
-                # Look for divs with p elements that have labels
-                child_divs = div.find_all('div', recursive=False)
-                for child_div in child_divs:
-                    p_elements = child_div.find_all('p', recursive=False)
-                    if len(p_elements) >= 2:
-                        label = p_elements[0].get_text(strip=True).lower()
-                        value = p_elements[1].get_text(strip=True)
-                        
-                        if 'team size' in label:
-                            team_size = value
-                        elif 'location' in label:
-                            location = value
-                        elif 'foundation' in label:
-                            foundation_date = value
-                        elif 'funding stage' in label:
-                            funding_stage = value
-                        elif 'amount raised' in label:
-                            amount_raised = value
-            
-            # Extract sectors using correct CSS selector
-            sectors = []
-            sector_element = soup.select_one('div.gap-1:nth-child(3)')
-            if sector_element:
-                # Get all sector tags within this element
-                sector_tags = sector_element.find_all(['span', 'div'])
-                for tag in sector_tags:
-                    sector_text = tag.get_text(strip=True)
-                    if sector_text and len(sector_text) < 50 and sector_text not in sectors:
-                        sectors.append(sector_text)
-            
-            # Fallback to previous method if no sectors found
-            if not sectors:
-                sector_candidates = soup.find_all(['span', 'div', 'a'], class_=re.compile(r'tag|category|sector'))
-                for candidate in sector_candidates:
-                    sector_text = candidate.get_text(strip=True)
+            if 'website' in text_low:  # also covers "visit website"
+                website = href
+            elif 'linkedin' in text_low or 'linkedin.com' in href:
+                linkedin = href
+        website = clean_url(website)
+        linkedin = clean_url(linkedin)
+        
+        # Company details using label-based approach for better reliability
+        for root in search_roots:
+            info = cls.extract_company_info(root)
+            if any(info.values()):
+                break
+        location = info['location']
+        foundation_date = info['foundation_date']
+        team_size = info['team_size']
+        funding_stage = info['funding_stage']
+        amount_raised = info['amount_raised']
+        
+        # Extract sectors using correct CSS selector
+        sectors = []
+        sector_element = tree.css_first(cls.SECTORS_SELECTOR)
+        if sector_element:
+            # Get all sector tags within this element (css() also matches the element itself)
+            sector_tags = [tag for tag in sector_element.css('span, div') if tag != sector_element]
+            for tag in sector_tags:
+                sector_text = tag.text(strip=True)
+                if sector_text and len(sector_text) < 50 and sector_text not in sectors:
+                    sectors.append(sector_text)
+        
+        # Fallback to previous method if no sectors found
+        if not sectors:
+            for root in search_roots:
+                for candidate in root.css(SECTOR_FALLBACK_SELECTOR):
+                    sector_text = candidate.text(strip=True)
                     if sector_text and len(sector_text) < 50:
                         sectors.append(sector_text)
+                if sectors:
+                    break
+        
+        # Extract founder team members using CSS selectors
+        team_members = cls.extract_founders(tree, content_root)
+        
+        # Extract investors using CSS selectors
+        investors = cls.extract_investors(tree, content_root)
+        
+        return StartupData(
+            name=name,
+            description=description,
+            website=website,
+            linkedin=linkedin,
+            logo_url=logo_url,
+            location=location,
+            foundation_date=foundation_date,
+            team_size=team_size,
+            funding_stage=funding_stage,
+            amount_raised=amount_raised,
+            sectors=sectors,
+            team_members=team_members,
+            investors=investors,
+            c14_url=url,
+            uuid=uuid
+        )
+    
+    @classmethod
+    def extract_company_info(cls, tree) -> Dict[str, str]:
+        """Extract the label/value company details (location, team size, funding...)"""
+        info = {field: "" for _, field in cls.INFO_FIELDS}
+        
+        for row in tree.css(cls.INFO_SELECTOR):
+            p_elements = [child for child in row.iter() if child.tag == 'p']
+            if len(p_elements) < 2:
+                continue
             
-            # Extract founder team members using CSS selectors
-            team_members = self.extract_founders(soup)
+            match = cls.INFO_LABEL_RE.search(p_elements[0].text())
+            if match:
+                info[cls.INFO_FIELD_BY_KEYWORD[match.group().lower()]] = p_elements[1].text(strip=True)
+        
+        return info
+    
+    def _record_people(self, startup_data: StartupData):
+        """Collect founders, investors and their relationships for a scraped startup"""
+        name = startup_data.name
+        
+        # Collect founders and relationships
+        for founder in startup_data.team_members:
+            # Add to founders collection (avoid duplicates)
+            self.all_founders.setdefault(founder['name'], founder)
             
-            # Extract investors using CSS selectors
-            investors = self.extract_investors(soup)
+            # Add founding relationship with separate name and surname
+            full_name = founder['name'].strip()
+            name_parts = full_name.split()
+            person_name = name_parts[0] if name_parts else ""
+            person_surname = ' '.join(name_parts[1:]) if len(name_parts) > 1 else ""
             
-            # Collect founders and relationships
-            for founder in team_members:
-                # Add to founders collection (avoid duplicates)
-                if not any(f['name'] == founder['name'] for f in self.all_founders):
-                    self.all_founders.append(founder)
+            self.founding_relationships.append({
+                'person_name': person_name,
+                'person_surname': person_surname,
+                'startup_name': name,
+                'role': founder['role'],
+                'founding_date': startup_data.foundation_date,
+                'equity_percentage': '',
+                'is_current': 'true',
+                'exit_date': ''
+            })
+        
+        # Collect investors and relationships
+        for investor in startup_data.investors:
+            # Add to investors collection (avoid duplicates)
+            self.all_investors.setdefault(investor['name'], investor)
+            
+            # Add investment relationship
+            self.investment_relationships.append({
+                'investor_name': investor['name'],
+                'investor_type': investor['type'],
+                'startup_name': name,
+                'round_stage': startup_data.funding_stage,
+                'round_date': '',
+                'amount': startup_data.amount_raised,
+                'valuation_pre': '',
+                'valuation_post': '',
+                'is_lead_investor': '',
+                'board_seats': '',
+                'equity_percentage': ''
+            })
+    
+    @staticmethod
+    def _extract_people(container, limit: Optional[int] = None) -> List[Tuple[str, str, str]]:
+        """Return (name, linkedin, role) for each LinkedIn card in a team/investor container"""
+        people = []
+        
+        # A single walk of the container collects every LinkedIn card
+        for link in container.css(C14Scraper.LINKEDIN_LINK_SELECTOR)[:limit]:
+            try:
+                linkedin_url = clean_url(link.attributes.get('href') or '')
                 
-                # Add founding relationship with separate name and surname
-                full_name = founder['name'].strip()
-                name_parts = full_name.split()
-                person_name = name_parts[0] if name_parts else ""
-                person_surname = ' '.join(name_parts[1:]) if len(name_parts) > 1 else ""
+                # Name and role are the first and second p elements within the link: one query for both
+                paragraphs = link.css(C14Scraper.PERSON_PARAGRAPHS_SELECTOR)
+                name = paragraphs[0].text(strip=True) if paragraphs else ""
+                role = paragraphs[1].text(strip=True) if len(paragraphs) > 1 else ""
                 
-                self.founding_relationships.append({
-                    'person_name': person_name,
-                    'person_surname': person_surname,
-                    'startup_name': name,
-                    'role': founder['role'],
-                    'founding_date': foundation_date,
-                    'equity_percentage': '',
-                    'is_current': 'true',
-                    'exit_date': ''
-                })
-            
-            # Collect investors and relationships
-            for investor in investors:
-                # Add to investors collection (avoid duplicates)
-                if not any(inv['name'] == investor['name'] for inv in self.all_investors):
-                    self.all_investors.append(investor)
+                if name:
+                    people.append((name, linkedin_url, role))
+                    
+            except Exception as e:
+                logger.warning(f"Error extracting person data from link: {e}")
+                continue
                 
-                # Add investment relationship
-                self.investment_relationships.append({
-                    'investor_name': investor['name'],
-                    'investor_type': investor['type'],
-                    'startup_name': name,
-                    'round_stage': funding_stage,
-                    'round_date': '',
-                    'amount': amount_raised,
-                    'valuation_pre': '',
-                    'valuation_post': '',
-                    'is_lead_investor': '',
-                    'board_seats': '',
-                    'equity_percentage': ''
-                })
-            
-            return StartupData(
-                name=name,
-                description=description,
-                website=website,
-                linkedin=linkedin,
-                logo_url=logo_url,
-                location=location,
-                foundation_date=foundation_date,
-                team_size=team_size,
-                funding_stage=funding_stage,
-                amount_raised=amount_raised,
-                sectors=sectors,
-                team_members=team_members,
-                investors=investors,
-                c14_url=url,
-                uuid=uuid
-            )
-            
-        except Exception as e:
-            logger.error(f"Error scraping startup details from {url}: {e}")
-            return None
+        return people
+    
+    @staticmethod
+    def _div_at(root, path: Tuple[int, ...]):
+        """Follow div:nth-child(n) steps down from root, e.g. (7, 2, 2); None if the path is missing"""
+        node = root
+        for position in path:
+            # Only elements count for nth-child, iter() also yields comment nodes
+            children = [child for child in node.iter() if child.tag != '-comment']
+            if len(children) < position or children[position - 1].tag != 'div':
+                return None
+            node = children[position - 1]
+        return node
     
-    def extract_founders(self, soup) -> List[Dict]:
+    @staticmethod
+    def extract_founders(tree: LexborHTMLParser, content_root=None) -> List[Dict]:
         """Extract founder information using CSS selectors"""
         founders = []
         
         try:
-            # Use the specific founder section selector
-            founder_container = soup.select_one('.mb-0 > div:nth-child(7) > div:nth-child(2) > div:nth-child(2)')
+            # Use the specific founder section, walking down from the content root when it is known
+            founder_container = None
+            if content_root is not None:
+                founder_container = C14Scraper._div_at(content_root, C14Scraper.FOUNDERS_PATH)
+            if founder_container is None:
+                # The first .mb-0 may not be the section container, the full selector tries every .mb-0
+                founder_container = tree.css_first(C14Scraper.FOUNDERS_SELECTOR)
             
             if founder_container:
-                # Find all LinkedIn links within the founder container only
-                founder_links = founder_container.find_all('a', href=lambda href: href and 'linkedin.com' in href)
-                
-                for link in founder_links:
-                    try:
-                        linkedin_url = clean_url(link.get('href', ''))
-                        
-                        # Extract name from first p element within the link
-                        name_element = link.select_one('div > div > p:nth-child(1)')
-                        name = name_element.get_text(strip=True) if name_element else ""
-                        
-                        # Extract role from second p element within the link
-                        role_element = link.select_one('div > div > p:nth-child(2)')
-                        role = role_element.get_text(strip=True) if role_element else ""
-                        
+                for name, linkedin_url, role in C14Scraper._extract_people(founder_container):
+                    founders.append({
+                        'name': name,
+                        'linkedin': linkedin_url,
                         # Clean role to avoid CSV issues with pipe separator
-                        role = role.replace('|', ' & ')  # Replace pipe with ampersand
-                        
-                        if name:
-                            founders.append({
-                                'name': name,
-                                'linkedin': linkedin_url,
-                                'role': role
-                            })
-                            
-                    except Exception as e:
-                        logger.warning(f"Error extracting founder data from link: {e}")
-                        continue
+                        'role': role.replace('|', ' & ')
+                    })
             else:
                 logger.info("No founder container found")
                     
@@ -414,39 +673,28 @@ class C14Scraper:
             
         return founders
     
-    def extract_investors(self, soup) -> List[Dict]:
+    @staticmethod
+    def extract_investors(tree: LexborHTMLParser, content_root=None) -> List[Dict]:
         """Extract investor information using CSS selectors"""
         investors = []
         
         try:
-            # Use the specific investor section selector
-            investor_container = soup.select_one('.mb-0 > div:nth-child(8) > div:nth-child(2) > div:nth-child(2)')
+            # Use the specific investor section, walking down from the content root when it is known
+            investor_container = None
+            if content_root is not None:
+                investor_container = C14Scraper._div_at(content_root, C14Scraper.INVESTORS_PATH)
+            if investor_container is None:
+                # The first .mb-0 may not be the section container, the full selector tries every .mb-0
+                investor_container = tree.css_first(C14Scraper.INVESTORS_SELECTOR)
             
             if investor_container:
-                # Find all LinkedIn links within the investor container only
-                investor_links = investor_container.find_all('a', href=lambda href: href and 'linkedin.com' in href)
-                
-                for link in investor_links:
-                    try:
-                        linkedin_url = clean_url(link.get('href', ''))
-                        
-                        # Extract name from first p element within the link
-                        name_element = link.select_one('div > div > p:nth-child(1)')
-                        name = name_element.get_text(strip=True) if name_element else ""
-                        
-                        if name:
-                            # Determine investor type based on LinkedIn URL
-                            investor_type = 'VC_Firm' if '/company/' in linkedin_url else 'Angel_Syndicate'
-                            
-                            investors.append({
-                                'name': name,
-                                'linkedin': linkedin_url,
-                                'type': investor_type
-                            })
-                            
-                    except Exception as e:
-                        logger.warning(f"Error extracting investor data from link: {e}")
-                        continue
+                for name, linkedin_url, _ in C14Scraper._extract_people(investor_container):
+                    investors.append({
+                        'name': name,
+                        'linkedin': linkedin_url,
+                        # Determine investor type based on LinkedIn URL
+                        'type': 'VC_Firm' if '/company/' in linkedin_url else 'Angel_Syndicate'
+                    })
             else:
                 logger.info("No investor container found")
                         
@@ -455,9 +703,13 @@ class C14Scraper:
             
         return investors
     
-    def scrape_all_startups(self, max_pages: int = None, max_startups: int = None) -> List[StartupData]:
+    def scrape_all_startups(self, max_pages: int = None, max_startups: int = None,
+                            output_csv: Optional[str] = None) -> List[StartupData]:
         """
         Scrape all startups from C14.so
+        
+        If output_csv is given, each startup is written to that file as soon as it is
+        parsed instead of being kept in memory, and the returned list is empty.
         """
         logger.info("Starting C14.so scraping...")
         
@@ -468,12 +720,127 @@ class C14Scraper:
             startup_links = startup_links[:max_startups]
         
         startups_data = []
+        saved = 0
+        writer = None
+        
+        def handle(startup_data: Optional[StartupData], name: str, desc: str):
+            nonlocal saved
+            if not startup_data:
+                return
+            self._record_people(startup_data)
+            
+            # Use the name and description from the list page if detailed scraping didn't get them
+            if not startup_data.name:
+                startup_data.name = name
+            if not startup_data.description:
+                startup_data.description = desc
+            
+            if writer:
+                writer.writerow(self._startup_to_row(startup_data))
+                saved += 1
+            else:
+                startups_data.append(startup_data)
         
-        for i, (name, desc, url, uuid) in enumerate(startup_links, 1):
-            logger.info(f"Scraping startup {i}/{len(startup_links)}: {name}")
+        # Pages are downloaded here (at the configured delay) while the process pool parses
+        # the ones already fetched; at most `window` pages are in flight, so with output_csv
+        # rows are written as they come and memory does not grow with the number of startups
+        workers = os.cpu_count() or 1
+        window = 2 * workers
+        with ProcessPoolExecutor(max_workers=workers) as parser_pool, \
+                (open(output_csv, 'w', newline='', encoding='utf-8') if output_csv else nullcontext()) as csv_file:
+            writer = self._csv_writer(csv_file, STARTUP_CSV_FIELDS) if output_csv else None
+            pending = deque()
             
-            startup_data = self.scrape_startup_details(url, uuid)
+            for i, (name, desc, url, uuid) in enumerate(startup_links, 1):
+                logger.info(f"Scraping startup {i}/{len(startup_links)}: {name}")
+                html = self._fetch_detail_html(url)
+                pending.append((parser_pool.submit(C14Scraper._parse_detail_page, html, url, uuid), name, desc))
+                
+                # Handle results in order once the window is full
+                while len(pending) >= window or (pending and pending[0][0].done()):
+                    future, first_name, first_desc = pending.popleft()
+                    handle(future.result(), first_name, first_desc)
+                
+                # Rate limiting
+                time.sleep(self.delay)
+            
+            while pending:
+                future, first_name, first_desc = pending.popleft()
+                handle(future.result(), first_name, first_desc)
+        
+        if writer:
+            logger.info(f"Successfully scraped {saved} startups to {output_csv}")
+        else:
+            logger.info(f"Successfully scraped {len(startups_data)} startups")
+        return startups_data
+    
+    async def _fetch(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                     bucket: AsyncTokenBucket, url: str, max_retries: int = 3) -> Optional[str]:
+        """Fetch a page with bounded concurrency, honouring the server's rate limit headers on 429/503"""
+        async with semaphore:
+            for attempt in range(max_retries + 1):
+                async with bucket, session.get(url) as response:
+                    if response.status in (429, 503) and attempt < max_retries:
+                        # Prefer the server's own hint, otherwise back off exponentially
+                        retry_after = _retry_after_seconds(response.headers)
+                        wait = retry_after if retry_after is not None else max(self.delay, 1.0) * 2 ** attempt
+                        logger.warning(f"{url} returned {response.status}, retrying in {wait:.1f}s")
+                        bucket.pause(wait)
+                        continue
+                    response.raise_for_status()
+                    return await response.text(encoding='utf-8', errors='replace')
+        return None
+    
+    async def scrape_all_startups_async(self, max_pages: int = None, max_startups: int = None,
+                                        max_concurrency: int = 8) -> List[StartupData]:
+        """
+        Scrape all startups from C14.so, fetching detail pages concurrently.
+        Requests are spaced by self.delay on average; HTML parsing runs in a process pool
+        so it overlaps with network I/O.
+        """
+        logger.info("Starting C14.so scraping (async)...")
+        
+        # Listing pages are paginated until an empty page, so they stay sequential
+        startup_links = await asyncio.to_thread(self.get_startup_links, max_pages)
+        
+        if max_startups:
+            startup_links = startup_links[:max_startups]
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        bucket = AsyncTokenBucket(rate=1 / self.delay if self.delay > 0 else float('inf'),
+                                  capacity=max_concurrency)
+        connector = aiohttp.TCPConnector(limit_per_host=max_concurrency, keepalive_timeout=60)
+        headers = {'User-Agent': self.session.headers['User-Agent']}
+        loop = asyncio.get_running_loop()
+        
+        if self.cache_name:
+            # Detail pages go to their own sqlite file next to the requests-cache one
+            from aiohttp_client_cache import CachedSession, SQLiteBackend
+            cache = SQLiteBackend(f'{self.cache_name}_async', expire_after=self.CACHE_EXPIRE_AFTER)
+            client_session = CachedSession(cache=cache, connector=connector, headers=headers)
+        else:
+            client_session = aiohttp.ClientSession(connector=connector, headers=headers)
+        
+        async with client_session as session:
+            with ProcessPoolExecutor() as executor:
+                
+                async def scrape(url: str, uuid: str) -> Optional[StartupData]:
+                    try:
+                        html = await self._fetch(session, semaphore, bucket, url)
+                        if html is None:
+                            return None
+                        return await loop.run_in_executor(executor, C14Scraper.parse_startup_details, html, url, uuid)
+                    except Exception as e:
+                        logger.error(f"Error scraping startup details from {url}: {e}")
+                        return None
+                
+                results = await asyncio.gather(*[scrape(url, uuid) for _, _, url, uuid in startup_links])
+        
+        startups_data = []
+        for (name, desc, url, uuid), startup_data in zip(startup_links, results):
             if startup_data:
+                self._record_people(startup_data)
+                
                 # Use the name and description from the list page if detailed scraping didn't get them
                 if not startup_data.name:
                     startup_data.name = name
@@ -481,174 +848,115 @@ class C14Scraper:
                     startup_data.description = desc
                     
                 startups_data.append(startup_data)
-            
-            # Rate limiting
-            time.sleep(self.delay)
         
         logger.info(f"Successfully scraped {len(startups_data)} startups")
         return startups_data
     
+    @staticmethod
+    def _startup_to_row(startup: StartupData) -> Dict:
+        """Convert to our Startup entity format"""
+        return {
+            'name': startup.name,
+            'description': startup.description,
+            'website': startup.website,
+            'founded_year': _extract_year(startup.foundation_date),
+            'stage': startup.funding_stage if startup.funding_stage != 'Unknown' else '',
+            'sector': ', '.join(startup.sectors),
+            'business_model': '',
+            'headquarters': startup.location,
+            'employee_count': startup.team_size,
+            'status': 'active',
+            'total_funding': _extract_funding_amount(startup.amount_raised),
+            'last_funding_date': '',
+            'exit_date': '',
+            'exit_value': ''
+        }
+    
+    @staticmethod
+    def _write_csv(filename: str, fieldnames: Tuple[str, ...], rows: Iterable[Dict]):
+        """Write rows to a pipe separated CSV file, one at a time"""
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            C14Scraper._csv_writer(f, fieldnames).writerows(rows)
+    
+    @staticmethod
+    def _csv_writer(f, fieldnames: Tuple[str, ...]) -> csv.DictWriter:
+        """Create a CSV writer and write its header"""
+        # Use pipe separator to avoid issues with commas and semicolons in descriptions
+        writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter='|', lineterminator='\n')
+        writer.writeheader()
+        return writer
+    
     def save_to_csv(self, startups: List[StartupData], filename: str = "c14_startups.csv"):
         """
         Save scraped startup data to CSV format compatible with our CSV importer
         """
-        import pandas as pd
-        
-        data = []
-        for startup in startups:
-            # Convert to our Startup entity format
-            row = {
-                'name': startup.name,
-                'description': startup.description,
-                'website': startup.website,
-                'founded_year': self._extract_year(startup.foundation_date),
-                'stage': startup.funding_stage if startup.funding_stage != 'Unknown' else '',
-                'sector': ', '.join(startup.sectors),
-                'business_model': '',
-                'headquarters': startup.location,
-                'employee_count': startup.team_size,
-                'status': 'active',
-                'total_funding': self._extract_funding_amount(startup.amount_raised),
-                'last_funding_date': '',
-                'exit_date': '',
-                'exit_value': ''
-            }
-            data.append(row)
-        
-        df = pd.DataFrame(data)
-        # Use pipe separator to avoid issues with commas and semicolons in descriptions
-        df.to_csv(filename, index=False, sep='|')
-        logger.info(f"Saved {len(data)} startups to {filename}")
+        self._write_csv(filename, STARTUP_CSV_FIELDS, (self._startup_to_row(startup) for startup in startups))
+        logger.info(f"Saved {len(startups)} startups to {filename}")
         
         return filename
     
+    @staticmethod
+    def _founder_to_row(founder: Dict) -> Dict:
+        """Convert a founder to our Person entity format"""
+        # Split name into name and surname
+        first_name, _, surname = founder['name'].partition(' ')
+        
+        return {
+            'name': first_name,
+            'surname': surname,
+            'role_type': founder['role'],
+            'linkedin_url': founder['linkedin'],
+            'twitter_handle': '',
+            'biography': '',
+            'location': '',
+            'birth_year': '',
+            'education': '',
+            'previous_experience': '',
+            'specialization': founder['role'],
+            'reputation_score': ''
+        }
+    
     def save_founders_to_csv(self, filename: str = "c14_founders.csv"):
         """Save founder data to CSV format for Person entity import"""
-        import pandas as pd
-        
-        data = []
-        for founder in self.all_founders:
-            # Split name into name and surname
-            name_parts = founder['name'].split(' ', 1)
-            first_name = name_parts[0] if name_parts else founder['name']
-            surname = name_parts[1] if len(name_parts) > 1 else ""
-            
-            row = {
-                'name': first_name,
-                'surname': surname,
-                'role_type': founder['role'],
-                'linkedin_url': founder['linkedin'],
-                'twitter_handle': '',
-                'biography': '',
-                'location': '',
-                'birth_year': '',
-                'education': '',
-                'previous_experience': '',
-                'specialization': founder['role'],
-                'reputation_score': ''
-            }
-            data.append(row)
-        
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False, sep='|')
-        logger.info(f"Saved {len(data)} founders to {filename}")
+        self._write_csv(filename, PERSON_CSV_FIELDS, (self._founder_to_row(founder) for founder in self.all_founders.values()))
+        logger.info(f"Saved {len(self.all_founders)} founders to {filename}")
         return filename
     
+    @staticmethod
+    def _investor_to_row(investor: Dict) -> Dict:
+        """Convert an investor to our VC_Firm entity format"""
+        return {
+            'name': investor['name'],
+            'description': '',
+            'website': '',
+            'founded_year': '',
+            'headquarters': '',
+            'type': investor['type'],
+            'investment_focus': '',
+            'stage_focus': '',
+            'geographic_focus': '',
+            'team_size': '',
+            'assets_under_management': '',
+            'portfolio_companies_count': ''
+        }
+    
     def save_investors_to_csv(self, filename: str = "c14_investors.csv"):
         """Save investor data to CSV format for VC_Firm entity import"""
-        import pandas as pd
-        
-        data = []
-        for investor in self.all_investors:
-            row = {
-                'name': investor['name'],
-                'description': '',
-                'website': '',
-                'founded_year': '',
-                'headquarters': '',
-                'type': investor['type'],
-                'investment_focus': '',
-                'stage_focus': '',
-                'geographic_focus': '',
-                'team_size': '',
-                'assets_under_management': '',
-                'portfolio_companies_count': ''
-            }
-            data.append(row)
-        
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False, sep='|')
-        logger.info(f"Saved {len(data)} investors to {filename}")
+        self._write_csv(filename, INVESTOR_CSV_FIELDS, (self._investor_to_row(investor) for investor in self.all_investors.values()))
+        logger.info(f"Saved {len(self.all_investors)} investors to {filename}")
         return filename
     
     def save_founding_relationships_to_csv(self, filename: str = "c14_founding_relationships.csv"):
         """Save founding relationships to CSV"""
-        import pandas as pd
-        
-        df = pd.DataFrame(self.founding_relationships)
-        df.to_csv(filename, index=False, sep='|')
+        self._write_csv(filename, FOUNDING_RELATIONSHIP_CSV_FIELDS, self.founding_relationships)
         logger.info(f"Saved {len(self.founding_relationships)} founding relationships to {filename}")
         return filename
     
     def save_investment_relationships_to_csv(self, filename: str = "c14_investment_relationships.csv"):
         """Save investment relationships to CSV"""
-        import pandas as pd
-        
-        df = pd.DataFrame(self.investment_relationships)
-        df.to_csv(filename, index=False, sep='|')
+        self._write_csv(filename, INVESTMENT_RELATIONSHIP_CSV_FIELDS, self.investment_relationships)
         logger.info(f"Saved {len(self.investment_relationships)} investment relationships to {filename}")
         return filename
-    
-    def _extract_year(self, date_str: str) -> Optional[int]:
-        """Extract year from date string"""
-        if not date_str:
-            return None
-        
-        # Look for 4-digit year
-        year_match = re.search(r'\b(19|20)\d{2}\b', date_str)
-        if year_match:
-            return int(year_match.group())
-        return None
-    
-    def _extract_employee_count(self, team_size_str: str) -> Optional[int]:
-        """Extract employee count from team size string"""
-        if not team_size_str:
-            return None
-        
-        # Handle ranges like "501-1000"
-        if '-' in team_size_str:
-            parts = team_size_str.split('-')
-            try:
-                # Return the midpoint of the range
-                min_val = int(parts[0])
-                max_val = int(parts[1])
-                return (min_val + max_val) // 2
-            except:
-                pass
-        
-        # Extract single number
-        number_match = re.search(r'\d+', team_size_str)
-        if number_match:
-            return int(number_match.group())
-        
-        return None
-    
-    def _extract_funding_amount(self, amount_str: str) -> Optional[float]:
-        """Extract funding amount from amount string"""
-        if not amount_str:
-            return None
-        
-        # Remove currency symbols and convert to float
-        amount_clean = re.sub(r'[^\d.,]', '', amount_str)
-        if not amount_clean:
-            return None
-        
-        try:
-            # Handle different decimal separators
-            amount_clean = amount_clean.replace(',', '.')
-            return float(amount_clean)
-        except:
-            return None
 
 # CLI interface for testing
 if __name__ == "__main__":
@@ -659,15 +967,26 @@ if __name__ == "__main__":
     parser.add_argument('--max-startups', type=int, help='Maximum startups to scrape')
     parser.add_argument('--output', default='c14_startups.csv', help='Output CSV file')
     parser.add_argument('--delay', type=float, default=1.0, help='Delay between requests (seconds)')
+    parser.add_argument('--cache', metavar='NAME', help='Cache HTTP responses in NAME sqlite databases (needs requests-cache and aiohttp-client-cache)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Maximum concurrent detail page requests')
     
     args = parser.parse_args()
     
     # Set up logging
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+    
     # Create scraper and run
-    scraper = C14Scraper(delay=args.delay)
-    startups = scraper.scrape_all_startups(max_pages=args.max_pages, max_startups=args.max_startups)
+    scraper = C14Scraper(delay=args.delay, cache_name=args.cache)
+    startups = run(scraper.scrape_all_startups_async(
+        max_pages=args.max_pages, max_startups=args.max_startups, max_concurrency=args.concurrency
+    ))
     
     if startups:
         # Save startup data
@@ -1,31 +1,270 @@
+import asyncio
 import pandas as pd
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Sequence
 from datetime import datetime, date
 from pathlib import Path
 import io
 
+from neo4j.exceptions import TransientError
+
+# pyarrow's multithreaded CSV parser is used when it is installed
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 from app.neo4j_repo import Neo4jRepository
 from app.models import *
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from an upload to detect its separator
+SNIFF_SAMPLE_SIZE = 8192
+
+# Date formats accepted in CSV files, tried in order (bare years are handled separately)
+DATE_FORMATS = ('%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y-%m-%d %H:%M:%S')
+
+# Employee counts: a range such as "11-50" (groups 1-2) or a single number (group 3)
+EMPLOYEE_COUNT_RE = re.compile(r'(\d+)\s*-\s*(\d+)|(\d+)')
+
+# INVESTS_IN properties and how they are parsed, only the values present in a row are written
+INVESTMENT_FIELDS = (
+    ('round_stage', 'text'), ('round_date', 'date'), ('amount', 'number'),
+    ('valuation_pre', 'number'), ('valuation_post', 'number'), ('is_lead_investor', 'boolean'),
+    ('board_seats', 'number'), ('equity_percentage', 'number')
+)
+
+# Numeric relationship columns, converted column-wise before the per-row import
+RELATIONSHIP_NUMBER_FIELDS = frozenset({
+    'equity_percentage', 'amount', 'management_fee', 'carried_interest', 'commitment_amount',
+    'equity_taken', 'funding_received', 'acquisition_value', 'initial_equity'
+})
+
+# Date and boolean columns of relationship CSVs, parsed as whole columns before the per-row loop
+RELATIONSHIP_DATE_FIELDS = frozenset({
+    'founding_date', 'exit_date', 'start_date', 'end_date', 'investment_date', 'commitment_date',
+    'demo_day_date', 'acquisition_date', 'spinoff_date'
+})
+RELATIONSHIP_BOOLEAN_FIELDS = frozenset({'is_current', 'lead_investor', 'board_seat', 'is_active'})
+
+# Lower-cased strings read as True in boolean columns
+TRUTHY_VALUES = frozenset({'true', '1', 'yes', 'y', 'si', 'sì'})
+
+# Errors kept per import, further errors are only counted
+MAX_IMPORT_ERRORS = 1000
+
+# Rows handled at a time by an import (chunked reads and slices of a loaded DataFrame)
+CSV_CHUNK_SIZE = 50000
+
+# Rows sent to Neo4j per UNWIND query
+BATCH_SIZE = 1000
+
+# Batches written in parallel (the driver is thread-safe and waits on the network most of the time)
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+# Batches in flight at once on the async driver
+ASYNC_CONCURRENCY = 64
+
+# Attempts for a batch hitting a transient error such as a deadlock between concurrent batches
+MAX_RETRIES = 3
+
+# Properties used by the repository to MERGE each entity type, rows missing them cannot be written
+ENTITY_MERGE_KEYS = {'Person': ('name', 'surname')}
+
+# Node labels matched by name for each relationship type, plus the CSV column holding a variable endpoint label
+RELATIONSHIP_ENDPOINTS = {
+    'FOUNDED': ('Person', 'Startup'),
+    'WORKS_AT': ('Person',),
+    'ANGEL_INVESTS_IN': ('Person', 'Startup'),
+    'MANAGES': ('VC_Firm', 'VC_Fund'),
+    'INVESTS_IN': ('Startup',),
+    'PARTICIPATED_IN': ('VC_Fund',),
+    'ACCELERATED_BY': ('Startup', 'Institution'),
+    'ACQUIRED': ('Corporate', 'Startup'),
+    'PARTNERS_WITH': ('Corporate',),
+    'MENTORS': ('Person',),
+    'SPUN_OFF_FROM': ('Startup',)
+}
+RELATIONSHIP_LABEL_COLUMNS = {
+    'WORKS_AT': 'org_type',
+    'INVESTS_IN': 'investor_type',
+    'PARTICIPATED_IN': 'investor_type',
+    'PARTNERS_WITH': 'partner_type',
+    'SPUN_OFF_FROM': 'parent_type'
+}
+
+# Required columns by entity type
+REQUIRED_ENTITY_COLUMNS = {
+    'Person': ('name',),
+    'Startup': ('name',),
+    'VC_Firm': ('name',),
+    'VC_Fund': ('name',),
+    'Angel_Syndicate': ('name',),
+    'Institution': ('name',),
+    'Corporate': ('name',)
+}
+
+# Required columns by relationship type
+REQUIRED_RELATIONSHIP_COLUMNS = {
+    'FOUNDED': ('person_name', 'person_surname', 'startup_name', 'founding_date'),
+    'WORKS_AT': ('person_name', 'org_name', 'org_type', 'role'),
+    'ANGEL_INVESTS_IN': ('person_name', 'startup_name', 'investment_date'),
+    'MANAGES': ('firm_name', 'fund_name', 'start_date'),
+    'INVESTS_IN': ('investor_name', 'investor_type', 'startup_name'),
+    'PARTICIPATED_IN': ('investor_name', 'investor_type', 'fund_name'),
+    'ACCELERATED_BY': ('startup_name', 'institution_name', 'program_name', 'start_date'),
+    'ACQUIRED': ('corporate_name', 'startup_name', 'acquisition_date'),
+    'PARTNERS_WITH': ('corporate_name', 'partner_name', 'partner_type', 'start_date'),
+    'MENTORS': ('mentor_name', 'mentee_name', 'start_date'),
+    'SPUN_OFF_FROM': ('startup_name', 'parent_name', 'parent_type', 'spinoff_date')
+}
+
+# Values of missing columns whose kind has a fixed default instead of the field's own
+MISSING_COLUMN_DEFAULTS = {'score': 0.0, 'boolean': False}
+
+# Columns read for each entity type: (field, kind, default used when the column is missing).
+# Kinds: 'text' is passed through, 'number' becomes a float (None when empty, zero or invalid),
+# 'score' a float defaulting to 0, 'employees' an employee count, 'date' a date and 'boolean' a bool.
+ENTITY_FIELDS = {
+    'Person': [
+        ('name', 'text', None), ('surname', 'text', None), ('role_type', 'text', 'other'),
+        ('linkedin_url', 'text', None), ('twitter_handle', 'text', None), ('biography', 'text', None),
+        ('location', 'text', None), ('birth_year', 'number', None), ('education', 'text', None),
+        ('previous_experience', 'text', None), ('specialization', 'text', None),
+        ('reputation_score', 'score', None)
+    ],
+    'Startup': [
+        ('name', 'text', None), ('description', 'text', None), ('website', 'text', None),
+        ('founded_year', 'number', None), ('stage', 'text', 'unknown'), ('sector', 'text', None),
+        ('business_model', 'text', None), ('headquarters', 'text', None),
+        ('employee_count', 'employees', None), ('status', 'text', 'active'),
+        ('total_funding', 'number', None), ('last_funding_date', 'date', None),
+        ('exit_date', 'date', None), ('exit_value', 'number', None)
+    ],
+    'VC_Firm': [
+        ('name', 'text', None), ('description', 'text', None), ('website', 'text', None),
+        ('founded_year', 'number', None), ('headquarters', 'text', None), ('type', 'text', 'independent'),
+        ('investment_focus', 'text', None), ('stage_focus', 'text', None),
+        ('geographic_focus', 'text', None), ('team_size', 'number', None),
+        ('assets_under_management', 'number', None), ('portfolio_companies_count', 'number', None)
+    ],
+    'VC_Fund': [
+        ('name', 'text', None), ('fund_size', 'number', None), ('vintage_year', 'number', None),
+        ('fund_number', 'text', None), ('status', 'text', 'unknown'), ('target_sectors', 'text', None),
+        ('target_stages', 'text', None), ('geographic_focus', 'text', None),
+        ('first_close_date', 'date', None), ('final_close_date', 'date', None),
+        ('investment_period', 'number', None), ('fund_life', 'number', None),
+        ('deployed_capital', 'number', None)
+    ],
+    'Angel_Syndicate': [
+        ('name', 'text', None), ('type', 'text', 'angel_syndicate'), ('description', 'text', None),
+        ('website', 'text', None), ('founded_year', 'number', None), ('headquarters', 'text', None),
+        ('members_count', 'number', None), ('investment_focus', 'text', None),
+        ('stage_focus', 'text', None), ('ticket_size_min', 'number', None),
+        ('ticket_size_max', 'number', None), ('total_investments', 'number', None)
+    ],
+    'Institution': [
+        ('name', 'text', None), ('type', 'text', 'other'), ('description', 'text', None),
+        ('website', 'text', None), ('founded_year', 'number', None), ('headquarters', 'text', None),
+        ('program_duration', 'number', None), ('batch_size', 'number', None),
+        ('sectors_focus', 'text', None), ('equity_taken', 'number', None),
+        ('funding_provided', 'number', None), ('portfolio_companies_count', 'number', None),
+        ('success_rate', 'number', None)
+    ],
+    'Corporate': [
+        ('name', 'text', None), ('description', 'text', None), ('website', 'text', None),
+        ('industry', 'text', None), ('founded_year', 'number', None), ('headquarters', 'text', None),
+        ('revenue', 'number', None), ('employee_count', 'employees', None),
+        ('stock_exchange', 'text', None), ('ticker', 'text', None), ('has_cvc_arm', 'boolean', None),
+        ('innovation_programs', 'text', None)
+    ]
+}
+
+# Columns of the downloadable CSV templates
+ENTITY_TEMPLATES = {
+    entity_type: tuple(field for field, _, _ in fields)
+    for entity_type, fields in ENTITY_FIELDS.items()
+}
+
+RELATIONSHIP_TEMPLATES = {
+    'FOUNDED': ('person_name', 'startup_name', 'role', 'founding_date', 'equity_percentage', 'is_current', 'exit_date'),
+    'WORKS_AT': ('person_name', 'org_name', 'org_type', 'role', 'start_date', 'end_date', 'seniority_level', 'is_current'),
+    'ANGEL_INVESTS_IN': ('person_name', 'startup_name', 'investment_date', 'round_stage', 'amount', 'lead_investor', 'board_seat'),
+    'MANAGES': ('firm_name', 'fund_name', 'management_fee', 'carried_interest', 'start_date'),
+    'INVESTS_IN': ('investor_name', 'investor_type', 'startup_name', 'round_stage', 'round_date', 'amount', 'valuation_pre', 'valuation_post', 'is_lead_investor', 'board_seats', 'equity_percentage'),
+    'PARTICIPATED_IN': ('investor_name', 'investor_type', 'fund_name', 'commitment_amount', 'commitment_date', 'lp_category'),
+    'ACCELERATED_BY': ('startup_name', 'institution_name', 'program_name', 'batch_name', 'start_date', 'end_date', 'equity_taken', 'funding_received', 'demo_day_date'),
+    'ACQUIRED': ('corporate_name', 'startup_name', 'acquisition_date', 'acquisition_value', 'acquisition_type', 'strategic_rationale', 'integration_status'),
+    'PARTNERS_WITH': ('corporate_name', 'partner_name', 'partner_type', 'partnership_type', 'start_date', 'description', 'is_active'),
+    'MENTORS': ('mentor_name', 'mentee_name', 'start_date', 'end_date', 'relationship_type', 'context'),
+    'SPUN_OFF_FROM': ('startup_name', 'parent_name', 'parent_type', 'spinoff_date', 'technology_transferred', 'initial_equity', 'support_provided')
+}
+
+# Template columns by (data type, entity or relationship type)
+TEMPLATES = {
+    **{('entity', name): columns for name, columns in ENTITY_TEMPLATES.items()},
+    **{('relationship', name): columns for name, columns in RELATIONSHIP_TEMPLATES.items()}
+}
+
+
+class ImportErrors:
+    """Errors collected during an import.
+    
+    Entries are stored as (rows, message) and only formatted as "Row N: ..." / "Rows A-B: ..." when read.
+    The first MAX_IMPORT_ERRORS are kept and the rest only counted, so len() is the total number of errors.
+    """
+    
+    def __init__(self, limit: Optional[int] = None):
+        self.limit = MAX_IMPORT_ERRORS if limit is None else limit
+        self.entries = []
+        self.dropped = 0
+    
+    def add(self, rows, message: str):
+        """Record an error for a row number, a (first, last) row span, or None for the whole file"""
+        if len(self.entries) < self.limit:
+            self.entries.append((rows, message))
+        else:
+            self.dropped += 1
+    
+    def append(self, message: str):
+        self.add(None, message)
+    
+    def extend(self, messages: List[str]):
+        for message in messages:
+            self.add(None, message)
+    
+    @staticmethod
+    def _format(entry) -> str:
+        rows, message = entry
+        if rows is None:
+            return message
+        if isinstance(rows, tuple):
+            return f"Rows {rows[0]}-{rows[1]}: {message}"
+        return f"Row {rows}: {message}"
+    
+    def __len__(self) -> int:
+        return len(self.entries) + self.dropped
+    
+    def __iter__(self):
+        return map(self._format, self.entries)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._format(entry) for entry in self.entries[index]]
+        return self._format(self.entries[index])
+
 class CSVImporter:
     """CSV Importer for Italian Tech Ecosystem Graph"""
     
-    def __init__(self, repo: Neo4jRepository):
+    def __init__(self, repo: Neo4jRepository, max_workers: int = MAX_WORKERS):
         self.repo = repo
-        
-        # Entity type mappings
-        self.entity_creators = {
-            'Person': self.repo.create_person,
-            'Startup': self.repo.create_startup,
-            'VC_Firm': self.repo.create_vc_firm,
-            'VC_Fund': self.repo.create_vc_fund,
-            'Angel_Syndicate': self.repo.create_angel_syndicate,
-            'Institution': self.repo.create_institution,
-            'Corporate': self.repo.create_corporate
-        }
+        self.max_workers = max_workers
         
         # Relationship type mappings
         self.relationship_creators = {
@@ -41,20 +280,33 @@ class CSVImporter:
             'MENTORS': self.repo.create_mentorship_relationship,
             'SPUN_OFF_FROM': self.repo.create_spinoff_relationship
         }
+        
+        # Column converters by field kind ('text' columns are passed through)
+        self.column_parsers = {
+            'number': self.parse_number_column,
+            'score': self.parse_score_column,
+            'employees': self.parse_employee_count_column,
+            'date': self.parse_date_column,
+            'boolean': self.parse_boolean_column
+        }
     
-    def read_csv_file(self, uploaded_file) -> pd.DataFrame:
-        """Read CSV file with automatic separator detection"""
+    def read_csv_file(self, uploaded_file, chunksize: Optional[int] = None):
+        """Read CSV file with automatic separator detection.
+        
+        With chunksize, returns an iterator of DataFrames that import_entities/import_relationships
+        consume chunk by chunk instead of loading the whole file.
+        """
         try:
-            # Try to detect separator by reading first few lines
-            content = uploaded_file.read()
+            # Detect the separator from a small sample instead of decoding the whole file
+            sample = uploaded_file.read(SNIFF_SAMPLE_SIZE)
             uploaded_file.seek(0)  # Reset file pointer
             
-            # Convert bytes to string if needed
-            if isinstance(content, bytes):
-                content = content.decode('utf-8')
+            # Convert bytes to string if needed (the sample may end mid-character)
+            if isinstance(sample, bytes):
+                sample = sample.decode('utf-8', errors='ignore')
             
             # Check first line for separators
-            first_line = content.split('\n')[0] if content else ""
+            first_line = sample.splitlines()[0] if sample else ""
             
             # Count occurrences of potential separators
             comma_count = first_line.count(',')
@@ -70,8 +322,7 @@ class CSVImporter:
                 separator = ','
             
             # Read CSV with detected separator
-            uploaded_file.seek(0)  # Reset file pointer again
-            df = pd.read_csv(uploaded_file, sep=separator)
+            df = self._parse_csv(uploaded_file, separator, chunksize)
             
             logger.info(f"CSV read successfully with separator '{separator}'")
             return df
@@ -80,68 +331,59 @@ class CSVImporter:
             logger.error(f"Error reading CSV file: {e}")
             # Fallback: try with comma separator
             uploaded_file.seek(0)
-            return pd.read_csv(uploaded_file, sep=',')
+            return pd.read_csv(uploaded_file, sep=',', chunksize=chunksize)
+    
+    def _parse_csv(self, uploaded_file, separator: str, chunksize: Optional[int] = None):
+        """Parse the upload with the pyarrow engine if available, falling back to pandas' C engine"""
+        # The pyarrow engine cannot read in chunks
+        if HAS_PYARROW and chunksize is None:
+            try:
+                return pd.read_csv(uploaded_file, sep=separator, engine='pyarrow')
+            except Exception as e:
+                logger.warning(f"pyarrow could not parse the CSV, retrying with the C engine: {e}")
+                uploaded_file.seek(0)
+        
+        return pd.read_csv(uploaded_file, sep=separator, engine='c', low_memory=False, chunksize=chunksize)
     
     def validate_csv_structure(self, df: pd.DataFrame, entity_type: str) -> List[str]:
         """Validate CSV structure for entity type"""
-        errors = []
-        
-        # Required columns by entity type
-        required_columns = {
-            'Person': ['name'],
-            'Startup': ['name'],
-            'VC_Firm': ['name'],
-            'VC_Fund': ['name'],
-            'Angel_Syndicate': ['name'],
-            'Institution': ['name'],
-            'Corporate': ['name']
-        }
-        
-        if entity_type in required_columns:
-            for col in required_columns[entity_type]:
-                if col not in df.columns:
-                    errors.append(f"Missing required column: {col}")
-        
-        return errors
+        columns = set(df.columns)
+        return [
+            f"Missing required column: {col}"
+            for col in REQUIRED_ENTITY_COLUMNS.get(entity_type, ())
+            if col not in columns
+        ]
     
     def validate_relationship_csv(self, df: pd.DataFrame, relationship_type: str) -> List[str]:
         """Validate CSV structure for relationship type"""
-        errors = []
-        
-        # Required columns by relationship type
-        required_columns = {
-            'FOUNDED': ['person_name', 'person_surname', 'startup_name', 'founding_date'],
-            'WORKS_AT': ['person_name', 'org_name', 'org_type', 'role'],
-            'ANGEL_INVESTS_IN': ['person_name', 'startup_name', 'investment_date'],
-            'MANAGES': ['firm_name', 'fund_name', 'start_date'],
-            'INVESTS_IN': ['investor_name', 'investor_type', 'startup_name'],
-            'PARTICIPATED_IN': ['investor_name', 'investor_type', 'fund_name'],
-            'ACCELERATED_BY': ['startup_name', 'institution_name', 'program_name', 'start_date'],
-            'ACQUIRED': ['corporate_name', 'startup_name', 'acquisition_date'],
-            'PARTNERS_WITH': ['corporate_name', 'partner_name', 'partner_type', 'start_date'],
-            'MENTORS': ['mentor_name', 'mentee_name', 'start_date'],
-            'SPUN_OFF_FROM': ['startup_name', 'parent_name', 'parent_type', 'spinoff_date']
-        }
-        
-        if relationship_type in required_columns:
-            for col in required_columns[relationship_type]:
-                if col not in df.columns:
-                    errors.append(f"Missing required column: {col}")
-        
-        return errors
+        columns = set(df.columns)
+        return [
+            f"Missing required column: {col}"
+            for col in REQUIRED_RELATIONSHIP_COLUMNS.get(relationship_type, ())
+            if col not in columns
+        ]
     
-    def clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and prepare data for import"""
+    def clean_data(self, df: pd.DataFrame, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Clean and prepare data for import, keeping only the given columns (in that order) if any"""
         # Remove empty rows
         df = df.dropna(how='all')
         
-        # Strip whitespace from string columns
-        for col in df.select_dtypes(include=['object']).columns:
-            df[col] = df[col].astype(str).str.strip()
-            df[col] = df[col].replace('nan', None)
+        # Columns nobody reads are dropped before the string cleanup
+        if columns is not None:
+            df = df[[col for col in columns if col in df.columns]]
+        
+        # Strip whitespace from string columns in one pass, missing cells become None (blank ones stay "")
+        text_columns = df.select_dtypes(include=['object', 'string']).columns
+        if len(text_columns):
+            df[text_columns] = df[text_columns].apply(self._strip_text)
         
         return df
     
+    @staticmethod
+    def _strip_text(values: pd.Series) -> pd.Series:
+        text = values.astype('string').str.strip()
+        return text.astype(object).where(text.notna(), None)
+    
     def parse_date(self, date_str: Any) -> Optional[date]:
         """Parse date from various formats"""
         if pd.isna(date_str) or date_str is None:
@@ -160,7 +402,7 @@ class CSVImporter:
                         pass
                 
                 # Try different date formats
-                for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y-%m-%d %H:%M:%S']:
+                for fmt in DATE_FORMATS:
                     try:
                         return datetime.strptime(date_str, fmt).date()
                     except ValueError:
@@ -174,6 +416,28 @@ class CSVImporter:
         
         return None
     
+    def parse_date_column(self, values: pd.Series) -> pd.Series:
+        """Parse a whole column of dates, with one to_datetime pass per format instead of strptime per cell"""
+        if pd.api.types.is_datetime64_any_dtype(values):
+            parsed = values
+        else:
+            text = values.astype('string').str.strip()
+            parsed = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+            
+            # Year-only values (e.g. "2017") become January 1st
+            years = text.str.fullmatch(r'\d{4}').fillna(False).astype(bool)
+            parsed[years] = pd.to_datetime(text[years], format='%Y', errors='coerce')
+            
+            # Each format only sees the cells no earlier format could parse
+            for fmt in DATE_FORMATS:
+                pending = parsed.isna() & text.notna()
+                if not pending.any():
+                    break
+                parsed[pending] = pd.to_datetime(text[pending], format=fmt, errors='coerce')
+        
+        dates = parsed.dt.date.astype(object)
+        return dates.where(parsed.notna(), None)
+    
     def parse_boolean(self, value: Any) -> bool:
         """Parse boolean from various formats"""
         if pd.isna(value):
@@ -183,10 +447,20 @@ class CSVImporter:
             return value
         
         if isinstance(value, str):
-            return value.lower() in ['true', '1', 'yes', 'y', 'si', 'sì']
+            return value.lower() in TRUTHY_VALUES
         
         return bool(value)
     
+    def parse_boolean_column(self, values: pd.Series) -> pd.Series:
+        """Parse a whole column of booleans, with the set lookup done by isin instead of per cell"""
+        if pd.api.types.is_bool_dtype(values):
+            flags = values
+        elif pd.api.types.is_numeric_dtype(values):
+            flags = values.fillna(0) != 0
+        else:
+            flags = values.astype('string').str.lower().isin(TRUTHY_VALUES)
+        return flags.astype(bool).astype(object)
+    
     def parse_number(self, value: Any, default: float = 0.0) -> float:
         """Parse number from various formats"""
         if pd.isna(value):
@@ -197,255 +471,417 @@ class CSVImporter:
         except (ValueError, TypeError):
             return default
     
+    def parse_number_column(self, values: pd.Series) -> pd.Series:
+        """Convert a whole column to floats, zero counts as an empty cell as the old per-row truthiness check did"""
+        values = pd.to_numeric(values, errors='coerce')
+        return values.where(values != 0)
+    
+    def parse_score_column(self, values: pd.Series) -> pd.Series:
+        """Convert a whole column to floats, empty or invalid scores become 0"""
+        return pd.to_numeric(values, errors='coerce').fillna(0.0)
+    
     def parse_employee_count(self, value: Any) -> Optional[int]:
         """Parse employee count, handling ranges like '11-50'"""
         if pd.isna(value) or not value:
             return None
         
-        value_str = str(value).strip()
+        match = EMPLOYEE_COUNT_RE.search(str(value))
+        if not match:
+            return None
         
-        # Handle ranges like "11-50"
-        if '-' in value_str:
-            parts = value_str.split('-')
-            try:
-                # Return the midpoint of the range
-                min_val = int(parts[0].strip())
-                max_val = int(parts[1].strip())
-                return (min_val + max_val) // 2
-            except (ValueError, IndexError):
-                pass
-        
-        # Extract single number
-        import re
-        number_match = re.search(r'\d+', value_str)
-        if number_match:
-            try:
-                return int(number_match.group())
-            except ValueError:
-                pass
+        # Return the midpoint of a range, otherwise the number itself
+        low, high, single = match.groups()
+        if single is not None:
+            return int(single)
+        return (int(low) + int(high)) // 2
+    
+    def parse_employee_count_column(self, values: pd.Series) -> pd.Series:
+        """Parse a whole column of employee counts with a single regex extraction"""
+        groups = values.astype('string').str.extract(EMPLOYEE_COUNT_RE)
+        low, high, single = (pd.to_numeric(groups[i]) for i in range(3))
         
-        return None
+        counts = single.fillna((low + high) // 2).astype('Int64')
+        return counts.astype(object).where(counts.notna(), None)
+    
+    def import_entities(self, data, entity_type: str, batch_size: int = BATCH_SIZE) -> Dict[str, Any]:
+        """Import entities from a DataFrame or from an iterable of chunks (see read_csv_file's chunksize).
+        
+        Runs import_entities_async to completion, so it must not be called from a running event loop.
+        """
+        return asyncio.run(self.import_entities_async(data, entity_type, batch_size))
     
-    def import_entities(self, df: pd.DataFrame, entity_type: str) -> Dict[str, Any]:
-        """Import entities from DataFrame"""
+    @staticmethod
+    def _merge_key(entity_type: str):
+        """Partition key for entity rows: the values of the entity's MERGE keys"""
+        merge_keys = ENTITY_MERGE_KEYS.get(entity_type, ('name',))
+        return lambda data: tuple(data.get(key) for key in merge_keys)
+    
+    def _prepare_entity_rows(self, df: pd.DataFrame, entity_type: str, results: Dict[str, Any]) -> List[tuple]:
+        """Prepare a chunk of cleaned entity rows, returns the writable (row number, data) pairs"""
+        # Prepare all rows at once, column by column
+        try:
+            records = self._prepare_entity_records(df, entity_type)
+        except Exception as e:
+            logger.error(f"Error preparing {entity_type} data: {e}")
+            results['failed'] += len(df)
+            results['errors'].append(f"Invalid data: {str(e)}")
+            return []
+        
+        # Rows without the MERGE keys would make the whole batch fail, report them one by one
+        merge_keys = ENTITY_MERGE_KEYS.get(entity_type, ('name',))
+        valid_rows = []
+        for index, entity_data in zip(df.index, records):
+            if all(entity_data.get(key) for key in merge_keys):
+                valid_rows.append((index + 1, entity_data))
+            else:
+                results['failed'] += 1
+                results['errors'].add(index + 1, "Invalid data")
+        
+        return valid_rows
+    
+    async def import_entities_async(self, data, entity_type: str, batch_size: int = BATCH_SIZE,
+                                    concurrency: int = ASYNC_CONCURRENCY) -> Dict[str, Any]:
+        """Write entity batches concurrently on Neo4j's async driver, through a connection opened for this import.
+        
+        Rows sharing a MERGE key are written by one task in sequence, see import_entities for the sync entry point.
+        """
         results = {
-            'total': len(df),
+            'total': 0,
             'successful': 0,
             'failed': 0,
-            'errors': []
+            'errors': ImportErrors()
         }
         
-        # Validate structure
-        validation_errors = self.validate_csv_structure(df, entity_type)
-        if validation_errors:
-            results['errors'].extend(validation_errors)
-            return results
-        
-        # Clean data
-        df = self.clean_data(df)
-        
-        # Get creator function
-        creator_func = self.entity_creators.get(entity_type)
-        if not creator_func:
+        if entity_type not in ENTITY_FIELDS:
             results['errors'].append(f"Unknown entity type: {entity_type}")
             return results
         
-        # Process each row
-        for index, row in df.iterrows():
-            try:
-                # Prepare entity data based on type
-                entity_data = self._prepare_entity_data(row, entity_type)
+        connection = self.repo.connection.create_async_connection()
+        semaphore = asyncio.Semaphore(concurrency)
+        try:
+            if not await connection.connect():
+                results['errors'].append("Could not connect to Neo4j")
+                return results
+            
+            for position, df in enumerate(self._chunks(data)):
+                results['total'] += len(df)
                 
-                if entity_data:
-                    success = creator_func(entity_data)
-                    if success:
-                        results['successful'] += 1
-                    else:
-                        results['failed'] += 1
-                        results['errors'].append(f"Row {index + 1}: Failed to create {entity_type}")
-                else:
-                    results['failed'] += 1
-                    results['errors'].append(f"Row {index + 1}: Invalid data")
-                    
-            except Exception as e:
-                results['failed'] += 1
-                results['errors'].append(f"Row {index + 1}: {str(e)}")
+                # Validate structure, every chunk of a file has the same header
+                validation_errors = self.validate_csv_structure(df, entity_type) if position == 0 else None
+                if validation_errors:
+                    results['errors'].extend(validation_errors)
+                    return results
+                
+                df = self.clean_data(df, ENTITY_TEMPLATES[entity_type])
+                rows = self._prepare_entity_rows(df, entity_type, results)
+                
+                # Rows with the same MERGE key go to the same bucket, whose batches are written in sequence
+                bucket_count = max(1, min(concurrency, -(-len(rows) // batch_size)))
+                bucket_batches = [
+                    [bucket[start:start + batch_size] for start in range(0, len(bucket), batch_size)]
+                    for bucket in self._bucket_rows(rows, self._merge_key(entity_type), bucket_count) if bucket
+                ]
+                
+                bucket_outcomes = await asyncio.gather(
+                    *(self._write_bucket_async(connection, entity_type, batches, semaphore)
+                      for batches in bucket_batches)
+                )
+                for batches, outcomes in zip(bucket_batches, bucket_outcomes):
+                    for batch, outcome in zip(batches, outcomes):
+                        self._record_batch(batch, outcome, entity_type, results)
+        finally:
+            await connection.close()
         
         return results
     
-    def import_relationships(self, df: pd.DataFrame, relationship_type: str) -> Dict[str, Any]:
-        """Import relationships from DataFrame"""
+    async def _write_bucket_async(self, connection, entity_type: str, batches: List[List[tuple]],
+                                  semaphore: asyncio.Semaphore) -> List[Any]:
+        """Async counterpart of _write_bucket, a failed batch does not stop the ones after it"""
+        outcomes = []
+        for batch in batches:
+            try:
+                outcomes.append(await self._write_batch_async(connection, entity_type, batch, semaphore))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+    
+    async def _write_batch_async(self, connection, entity_type: str, batch: List[tuple],
+                                 semaphore: asyncio.Semaphore) -> int:
+        """Write one batch on the async connection, retrying transient errors like _write_with_retry"""
+        data = [entity_data for _, entity_data in batch]
+        async with semaphore:
+            for attempt in range(MAX_RETRIES):
+                try:
+                    return await self.repo.create_entities_batch_async(connection, entity_type, data)
+                except TransientError as e:
+                    if attempt == MAX_RETRIES - 1:
+                        raise
+                    logger.warning(f"Transient error writing batch, retrying (attempt {attempt + 1}): {e}")
+                    await asyncio.sleep(0.5 * 2 ** attempt)
+    
+    def import_relationships(self, data, relationship_type: str) -> Dict[str, Any]:
+        """Import relationships from a DataFrame or from an iterable of chunks (see read_csv_file's chunksize)"""
         results = {
-            'total': len(df),
+            'total': 0,
             'successful': 0,
             'failed': 0,
-            'errors': []
+            'errors': ImportErrors()
         }
         
-        # Validate structure
-        validation_errors = self.validate_relationship_csv(df, relationship_type)
-        if validation_errors:
-            results['errors'].extend(validation_errors)
-            return results
+        for position, df in enumerate(self._chunks(data)):
+            results['total'] += len(df)
+            
+            # Validate structure, every chunk of a file has the same header
+            validation_errors = self.validate_relationship_csv(df, relationship_type) if position == 0 else None
+            if validation_errors:
+                results['errors'].extend(validation_errors)
+                return results
+            
+            self._import_relationship_chunk(self.clean_data(df), relationship_type, results)
+        
+        return results
+    
+    def _import_relationship_chunk(self, df: pd.DataFrame, relationship_type: str, results: Dict[str, Any]):
+        """Write one chunk of cleaned relationship rows"""
+        # Index the endpoints matched by name
+        self._ensure_endpoint_indexes(df, relationship_type)
         
-        # Clean data
-        df = self.clean_data(df)
+        # Investments are the bulk of relationship files, write them in batches
+        if relationship_type == 'INVESTS_IN':
+            self._import_investments(df, results)
+            return
         
-        # Process each row
-        for index, row in df.iterrows():
+        # Convert numeric columns once, so the per-row parse_number calls never hit their exception path
+        for column in RELATIONSHIP_NUMBER_FIELDS.intersection(df.columns):
+            numbers = pd.to_numeric(df[column], errors='coerce')
+            df[column] = numbers.astype(object).where(numbers.notna(), None)
+        
+        # Same for dates and booleans, parse_date/parse_boolean then return the parsed values as they are
+        for column in RELATIONSHIP_DATE_FIELDS.intersection(df.columns):
+            df[column] = self.parse_date_column(df[column])
+        for column in RELATIONSHIP_BOOLEAN_FIELDS.intersection(df.columns):
+            df[column] = self.parse_boolean_column(df[column])
+        
+        if relationship_type == 'FOUNDED':
+            self._import_founders(df, results)
+            return
+        
+        # Process each row (plain dicts keep the row.get() interface without building a Series per row)
+        for index, row in zip(df.index, df.to_dict('records')):
             try:
                 success = self._create_relationship(row, relationship_type, index + 1)
                 if success:
                     results['successful'] += 1
                 else:
                     results['failed'] += 1
-                    results['errors'].append(f"Row {index + 1}: Failed to create {relationship_type}")
+                    results['errors'].add(index + 1, f"Failed to create {relationship_type}")
                     
             except Exception as e:
                 results['failed'] += 1
-                results['errors'].append(f"Row {index + 1}: {str(e)}")
+                results['errors'].add(index + 1, str(e))
+    
+    @staticmethod
+    def _chunks(data):
+        """Yield DataFrames of at most CSV_CHUNK_SIZE rows, so per-row intermediates stay bounded"""
+        if isinstance(data, pd.DataFrame):
+            # An empty frame still yields once, so its columns get validated
+            for start in range(0, max(len(data), 1), CSV_CHUNK_SIZE):
+                yield data.iloc[start:start + CSV_CHUNK_SIZE]
+        else:
+            yield from data
+    
+    def _ensure_endpoint_indexes(self, df: pd.DataFrame, relationship_type: str):
+        """Make sure every label matched by a relationship import has a name index"""
+        labels = set(RELATIONSHIP_ENDPOINTS.get(relationship_type, ()))
+        label_column = RELATIONSHIP_LABEL_COLUMNS.get(relationship_type)
+        if label_column in df.columns:
+            # Only known entity labels, the column comes straight from the uploaded file
+            labels.update(set(df[label_column].dropna().unique()) & ENTITY_FIELDS.keys())
         
-        return results
+        # (name) alone is already indexed for every label but Person, see UNIQUE_KEYS
+        for label in sorted(labels):
+            self.repo.ensure_index(label, 'name')
     
-    def _prepare_entity_data(self, row: pd.Series, entity_type: str) -> Optional[Dict[str, Any]]:
-        """Prepare entity data from CSV row"""
-        try:
-            if entity_type == 'Person':
-                return {
-                    'name': row.get('name'),
-                    'surname': row.get('surname'),
-                    'role_type': row.get('role_type', 'other'),
-                    'linkedin_url': row.get('linkedin_url'),
-                    'twitter_handle': row.get('twitter_handle'),
-                    'biography': row.get('biography'),
-                    'location': row.get('location'),
-                    'birth_year': self.parse_number(row.get('birth_year')) if row.get('birth_year') else None,
-                    'education': row.get('education'),
-                    'previous_experience': row.get('previous_experience'),
-                    'specialization': row.get('specialization'),
-                    'reputation_score': self.parse_number(row.get('reputation_score'), 0)
-                }
-            
-            elif entity_type == 'Startup':
-                return {
-                    'name': row.get('name'),
-                    'description': row.get('description'),
-                    'website': row.get('website'),
-                    'founded_year': self.parse_number(row.get('founded_year')) if row.get('founded_year') else None,
-                    'stage': row.get('stage', 'unknown'),
-                    'sector': row.get('sector'),
-                    'business_model': row.get('business_model'),
-                    'headquarters': row.get('headquarters'),
-                    'employee_count': self.parse_employee_count(row.get('employee_count')),
-                    'status': row.get('status', 'active'),
-                    'total_funding': self.parse_number(row.get('total_funding')) if row.get('total_funding') else None,
-                    'last_funding_date': self.parse_date(row.get('last_funding_date')),
-                    'exit_date': self.parse_date(row.get('exit_date')),
-                    'exit_value': self.parse_number(row.get('exit_value')) if row.get('exit_value') else None
-                }
-            
-            elif entity_type == 'VC_Firm':
-                return {
-                    'name': row.get('name'),
-                    'description': row.get('description'),
-                    'website': row.get('website'),
-                    'founded_year': self.parse_number(row.get('founded_year')) if row.get('founded_year') else None,
-                    'headquarters': row.get('headquarters'),
-                    'type': row.get('type', 'independent'),
-                    'investment_focus': row.get('investment_focus'),
-                    'stage_focus': row.get('stage_focus'),
-                    'geographic_focus': row.get('geographic_focus'),
-                    'team_size': self.parse_number(row.get('team_size')) if row.get('team_size') else None,
-                    'assets_under_management': self.parse_number(row.get('assets_under_management')) if row.get('assets_under_management') else None,
-                    'portfolio_companies_count': self.parse_number(row.get('portfolio_companies_count')) if row.get('portfolio_companies_count') else None
-                }
-            
-            elif entity_type == 'VC_Fund':
-                return {
-                    'name': row.get('name'),
-                    'fund_size': self.parse_number(row.get('fund_size')) if row.get('fund_size') else None,
-                    'vintage_year': self.parse_number(row.get('vintage_year')) if row.get('vintage_year') else None,
-                    'fund_number': row.get('fund_number'),
-                    'status': row.get('status', 'unknown'),
-                    'target_sectors': row.get('target_sectors'),
-                    'target_stages': row.get('target_stages'),
-                    'geographic_focus': row.get('geographic_focus'),
-                    'first_close_date': self.parse_date(row.get('first_close_date')),
-                    'final_close_date': self.parse_date(row.get('final_close_date')),
-                    'investment_period': self.parse_number(row.get('investment_period')) if row.get('investment_period') else None,
-                    'fund_life': self.parse_number(row.get('fund_life')) if row.get('fund_life') else None,
-                    'deployed_capital': self.parse_number(row.get('deployed_capital')) if row.get('deployed_capital') else None
-                }
-            
-            elif entity_type == 'Angel_Syndicate':
-                return {
-                    'name': row.get('name'),
-                    'type': row.get('type', 'angel_syndicate'),
-                    'description': row.get('description'),
-                    'website': row.get('website'),
-                    'founded_year': self.parse_number(row.get('founded_year')) if row.get('founded_year') else None,
-                    'headquarters': row.get('headquarters'),
-                    'members_count': self.parse_number(row.get('members_count')) if row.get('members_count') else None,
-                    'investment_focus': row.get('investment_focus'),
-                    'stage_focus': row.get('stage_focus'),
-                    'ticket_size_min': self.parse_number(row.get('ticket_size_min')) if row.get('ticket_size_min') else None,
-                    'ticket_size_max': self.parse_number(row.get('ticket_size_max')) if row.get('ticket_size_max') else None,
-                    'total_investments': self.parse_number(row.get('total_investments')) if row.get('total_investments') else None
-                }
-            
-            elif entity_type == 'Institution':
-                return {
-                    'name': row.get('name'),
-                    'type': row.get('type', 'other'),
-                    'description': row.get('description'),
-                    'website': row.get('website'),
-                    'founded_year': self.parse_number(row.get('founded_year')) if row.get('founded_year') else None,
-                    'headquarters': row.get('headquarters'),
-                    'program_duration': self.parse_number(row.get('program_duration')) if row.get('program_duration') else None,
-                    'batch_size': self.parse_number(row.get('batch_size')) if row.get('batch_size') else None,
-                    'sectors_focus': row.get('sectors_focus'),
-                    'equity_taken': self.parse_number(row.get('equity_taken')) if row.get('equity_taken') else None,
-                    'funding_provided': self.parse_number(row.get('funding_provided')) if row.get('funding_provided') else None,
-                    'portfolio_companies_count': self.parse_number(row.get('portfolio_companies_count')) if row.get('portfolio_companies_count') else None,
-                    'success_rate': self.parse_number(row.get('success_rate')) if row.get('success_rate') else None
-                }
+    def _import_investments(self, df: pd.DataFrame, results: Dict[str, Any]):
+        """Import INVESTS_IN relationships in batches, resolving each distinct endpoint only once"""
+        startup_ids = self.repo.resolve_node_ids('Startup', df['startup_name'].dropna().unique().tolist())
+        
+        for investor_type, group in df.groupby('investor_type', sort=False, dropna=False):
+            if investor_type not in ENTITY_FIELDS:
+                results['failed'] += len(group)
+                results['errors'].append(f"Unknown investor type: {investor_type} ({len(group)} rows)")
+                continue
             
-            elif entity_type == 'Corporate':
-                return {
-                    'name': row.get('name'),
-                    'description': row.get('description'),
-                    'website': row.get('website'),
-                    'industry': row.get('industry'),
-                    'founded_year': self.parse_number(row.get('founded_year')) if row.get('founded_year') else None,
-                    'headquarters': row.get('headquarters'),
-                    'revenue': self.parse_number(row.get('revenue')) if row.get('revenue') else None,
-                    'employee_count': self.parse_employee_count(row.get('employee_count')),
-                    'stock_exchange': row.get('stock_exchange'),
-                    'ticker': row.get('ticker'),
-                    'has_cvc_arm': self.parse_boolean(row.get('has_cvc_arm')),
-                    'innovation_programs': row.get('innovation_programs')
-                }
+            investor_ids = self.repo.resolve_node_ids(investor_type, group['investor_name'].dropna().unique().tolist())
+            properties = self._investment_properties(group)
+            rows = []
+            for index, investor_name, startup_name, props in zip(
+                group.index, group['investor_name'], group['startup_name'], properties
+            ):
+                investor_id = investor_ids.get(investor_name)
+                startup_id = startup_ids.get(startup_name)
+                if investor_id is None or startup_id is None:
+                    missing = f"{investor_type} '{investor_name}'" if investor_id is None else f"Startup '{startup_name}'"
+                    results['failed'] += 1
+                    results['errors'].add(index + 1, f"{missing} not found")
+                    continue
+                
+                rows.append((index + 1, {'investor_id': investor_id, 'startup_id': startup_id, 'properties': props}))
             
-            return None
+            # Every relationship of a startup goes to the same worker, so no two threads lock the same startup
+            self._write_batches(self.repo.create_investment_relationships_batch, rows, 'INVESTS_IN', results,
+                                partition_key=lambda data: data['startup_id'])
+    
+    def _import_founders(self, df: pd.DataFrame, results: Dict[str, Any]):
+        """Import FOUNDED relationships in batches, on columns already converted by _import_relationship_chunk"""
+        # Defaults for optional columns: role 'Founder', current founder, no equity (0 counts as missing) or exit date
+        equity = df['equity_percentage'] if 'equity_percentage' in df.columns else None
+        records = pd.DataFrame({
+            'person_name': df['person_name'],
+            'person_surname': df['person_surname'],
+            'startup_name': df['startup_name'],
+            'role': df['role'] if 'role' in df.columns else 'Founder',
+            'founding_date': df['founding_date'],
+            'equity_percentage': equity.where(equity != 0, None) if equity is not None else None,
+            'is_current': df['is_current'] if 'is_current' in df.columns else True,
+            'exit_date': df['exit_date'] if 'exit_date' in df.columns else None
+        }, index=df.index).to_dict('records')
+        
+        rows = [(index + 1, data) for index, data in zip(df.index, records)]
+        self._write_batches(self.repo.create_founded_relationships_batch, rows, 'FOUNDED', results,
+                            partition_key=lambda data: data['startup_name'])
+    
+    def _write_batches(self, writer, rows: List[tuple], label: str, results: Dict[str, Any],
+                       batch_size: int = BATCH_SIZE, partition_key=None):
+        """Send (row number, data) pairs to a batch writer and record the outcome in results.
+        
+        With partition_key, rows are bucketed by the hash of partition_key(data) and each
+        worker writes one bucket's batches in sequence, so rows sharing a key never
+        contend for the same node locks from two threads.
+        """
+        if partition_key is None:
+            buckets = [rows]
+        else:
+            buckets = self._bucket_rows(rows, partition_key, self.max_workers)
+        
+        bucket_batches = [
+            [bucket[start:start + batch_size] for start in range(0, len(bucket), batch_size)]
+            for bucket in buckets if bucket
+        ]
+        if not bucket_batches:
+            return
+        
+        if partition_key is None:
+            # Unpartitioned batches run concurrently, one task per batch
+            bucket_batches = [[batch] for batch in bucket_batches[0]]
+        
+        # Results are collected here in submission order
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(bucket_batches))) as executor:
+            futures = [
+                executor.submit(self._write_bucket, writer, batches)
+                for batches in bucket_batches
+            ]
+            for batches, future in zip(bucket_batches, futures):
+                for batch, outcome in zip(batches, future.result()):
+                    self._record_batch(batch, outcome, label, results)
+    
+    @staticmethod
+    def _bucket_rows(rows: List[tuple], partition_key, count: int) -> List[List[tuple]]:
+        """Split (row number, data) pairs into count buckets by the hash of partition_key(data)"""
+        buckets = [[] for _ in range(count)]
+        for row in rows:
+            buckets[hash(partition_key(row[1])) % count].append(row)
+        return buckets
+    
+    def _write_bucket(self, writer, batches: List[List[tuple]]) -> List[Any]:
+        """Write batches one after another, returns rows written or the exception raised for each"""
+        outcomes = []
+        for batch in batches:
+            try:
+                outcomes.append(self._write_with_retry(writer, [data for _, data in batch]))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+    
+    def _record_batch(self, batch: List[tuple], outcome, label: str, results: Dict[str, Any]):
+        """Add a batch's outcome (rows written, or the exception it raised) to results"""
+        span = (batch[0][0], batch[-1][0])
+        if isinstance(outcome, BaseException):
+            results['failed'] += len(batch)
+            results['errors'].add(span, str(outcome))
+            return
+        
+        results['successful'] += outcome
+        if outcome < len(batch):
+            results['failed'] += len(batch) - outcome
+            results['errors'].add(span, f"Failed to create {len(batch) - outcome} {label}")
+    
+    def _write_with_retry(self, writer, data: List[Dict[str, Any]]) -> int:
+        """Run a batch writer, retrying transient errors (deadlocks, lock timeouts) with a growing pause"""
+        for attempt in range(MAX_RETRIES):
+            try:
+                return writer(data)
+            except TransientError as e:
+                if attempt == MAX_RETRIES - 1:
+                    raise
+                logger.warning(f"Transient error writing batch, retrying (attempt {attempt + 1}): {e}")
+                time.sleep(0.5 * 2 ** attempt)
+    
+    def _prepare_entity_records(self, df: pd.DataFrame, entity_type: str) -> List[Dict[str, Any]]:
+        """Prepare entity data for a whole DataFrame, converting one column at a time"""
+        columns = {
+            field: self._prepare_column(df, field, kind, default)
+            for field, kind, default in ENTITY_FIELDS[entity_type]
+        }
+        return pd.DataFrame(columns, index=df.index).to_dict('records')
+    
+    def _prepare_column(self, df: pd.DataFrame, field: str, kind: str, default: Any) -> pd.Series:
+        """Convert a single CSV column to the values expected by the repository"""
+        if field not in df.columns:
+            # Missing columns behave like empty cells, except plain fields which take their default
+            default = MISSING_COLUMN_DEFAULTS.get(kind, default)
+            return pd.Series([default] * len(df), index=df.index, dtype=object)
+        
+        values = df[field]
+        parser = self.column_parsers.get(kind)
+        if parser:
+            values = parser(values)
+        
+        values = values.astype(object)
+        return values.where(values.notna(), None)
+    
+    def _investment_properties(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Build INVESTS_IN properties for every row, keeping only the values actually present"""
+        columns = []
+        for field, kind in INVESTMENT_FIELDS:
+            if field not in df.columns:
+                continue
             
-        except Exception as e:
-            logger.error(f"Error preparing {entity_type} data: {e}")
-            return None
+            # One mask per column instead of notna/strip checks on every row
+            values = df[field]
+            text = values.astype('string').str.strip()
+            present = text.ne('').fillna(False).astype(bool)
+            if kind == 'text':
+                parsed = text
+            elif kind == 'date':
+                parsed = self.parse_date_column(values)
+                present &= parsed.notna()
+            elif kind == 'number':
+                parsed = pd.to_numeric(values, errors='coerce').astype(float)
+                present &= parsed > 0
+            else:
+                parsed = self.parse_boolean_column(values)
+            columns.append((field, present.to_numpy(), parsed.astype(object).to_numpy()))
+        
+        return [
+            {field: parsed[i] for field, present, parsed in columns if present[i]}
+            for i in range(len(df))
+        ]
     
-    def _create_relationship(self, row: pd.Series, relationship_type: str, row_num: int) -> bool:
+    def _create_relationship(self, row: Dict[str, Any], relationship_type: str, row_num: int) -> bool:
         """Create relationship from CSV row"""
         try:
-            if relationship_type == 'FOUNDED':
-                data = {
-                    'role': row.get('role', 'Founder'),
-                    'founding_date': self.parse_date(row['founding_date']),
-                    'equity_percentage': self.parse_number(row.get('equity_percentage')) if row.get('equity_percentage') else None,
-                    'is_current': self.parse_boolean(row.get('is_current', True)),
-                    'exit_date': self.parse_date(row.get('exit_date'))
-                }
-                return self.repo.create_founded_relationship(row['person_name'], row['person_surname'], row['startup_name'], data)
-            
-            elif relationship_type == 'WORKS_AT':
+            if relationship_type == 'WORKS_AT':
                 data = {
                     'role': row['role'],
                     'start_date': self.parse_date(row.get('start_date')),
@@ -473,48 +909,6 @@ class CSVImporter:
                 }
                 return self.repo.create_fund_management_relationship(row['firm_name'], row['fund_name'], data)
             
-            elif relationship_type == 'INVESTS_IN':
-                data = {}
-                
-                # Only add properties that have actual values
-                if pd.notna(row.get('round_stage')) and str(row.get('round_stage')).strip():
-                    data['round_stage'] = str(row.get('round_stage')).strip()
-                
-                if pd.notna(row.get('round_date')) and str(row.get('round_date')).strip():
-                    parsed_date = self.parse_date(row['round_date'])
-                    if parsed_date:
-                        data['round_date'] = parsed_date
-                
-                if pd.notna(row.get('amount')) and str(row.get('amount')).strip():
-                    parsed_amount = self.parse_number(row.get('amount'))
-                    if parsed_amount is not None and parsed_amount > 0:
-                        data['amount'] = parsed_amount
-                
-                if pd.notna(row.get('valuation_pre')) and str(row.get('valuation_pre')).strip():
-                    parsed_val = self.parse_number(row.get('valuation_pre'))
-                    if parsed_val is not None and parsed_val > 0:
-                        data['valuation_pre'] = parsed_val
-                
-                if pd.notna(row.get('valuation_post')) and str(row.get('valuation_post')).strip():
-                    parsed_val = self.parse_number(row.get('valuation_post'))
-                    if parsed_val is not None and parsed_val > 0:
-                        data['valuation_post'] = parsed_val
-                
-                if pd.notna(row.get('is_lead_investor')) and str(row.get('is_lead_investor')).strip():
-                    data['is_lead_investor'] = self.parse_boolean(row.get('is_lead_investor'))
-                
-                if pd.notna(row.get('board_seats')) and str(row.get('board_seats')).strip():
-                    parsed_seats = self.parse_number(row.get('board_seats'))
-                    if parsed_seats is not None and parsed_seats > 0:
-                        data['board_seats'] = parsed_seats
-                
-                if pd.notna(row.get('equity_percentage')) and str(row.get('equity_percentage')).strip():
-                    parsed_equity = self.parse_number(row.get('equity_percentage'))
-                    if parsed_equity is not None and parsed_equity > 0:
-                        data['equity_percentage'] = parsed_equity
-                
-                return self.repo.create_investment_relationship(row['investor_name'], row['investor_type'], row['startup_name'], data)
-            
             elif relationship_type == 'PARTICIPATED_IN':
                 # Handle NaN values properly
                 commitment_amount = row.get('commitment_amount')
@@ -588,32 +982,4 @@ class CSVImporter:
     
     def get_template_columns(self, data_type: str, entity_or_relationship: str) -> List[str]:
         """Get template columns for CSV import"""
-        if data_type == 'entity':
-            templates = {
-                'Person': ['name', 'surname', 'role_type', 'linkedin_url', 'twitter_handle', 'biography', 'location', 'birth_year', 'education', 'previous_experience', 'specialization', 'reputation_score'],
-                'Startup': ['name', 'description', 'website', 'founded_year', 'stage', 'sector', 'business_model', 'headquarters', 'employee_count', 'status', 'total_funding', 'last_funding_date', 'exit_date', 'exit_value'],
-                'VC_Firm': ['name', 'description', 'website', 'founded_year', 'headquarters', 'type', 'investment_focus', 'stage_focus', 'geographic_focus', 'team_size', 'assets_under_management', 'portfolio_companies_count'],
-                'VC_Fund': ['name', 'fund_size', 'vintage_year', 'fund_number', 'status', 'target_sectors', 'target_stages', 'geographic_focus', 'first_close_date', 'final_close_date', 'investment_period', 'fund_life', 'deployed_capital'],
-                'Angel_Syndicate': ['name', 'type', 'description', 'website', 'founded_year', 'headquarters', 'members_count', 'investment_focus', 'stage_focus', 'ticket_size_min', 'ticket_size_max', 'total_investments'],
-                'Institution': ['name', 'type', 'description', 'website', 'founded_year', 'headquarters', 'program_duration', 'batch_size', 'sectors_focus', 'equity_taken', 'funding_provided', 'portfolio_companies_count', 'success_rate'],
-                'Corporate': ['name', 'description', 'website', 'industry', 'founded_year', 'headquarters', 'revenue', 'employee_count', 'stock_exchange', 'ticker', 'has_cvc_arm', 'innovation_programs']
-            }
-            return templates.get(entity_or_relationship, [])
-        
-        elif data_type == 'relationship':
-            templates = {
-                'FOUNDED': ['person_name', 'startup_name', 'role', 'founding_date', 'equity_percentage', 'is_current', 'exit_date'],
-                'WORKS_AT': ['person_name', 'org_name', 'org_type', 'role', 'start_date', 'end_date', 'seniority_level', 'is_current'],
-                'ANGEL_INVESTS_IN': ['person_name', 'startup_name', 'investment_date', 'round_stage', 'amount', 'lead_investor', 'board_seat'],
-                'MANAGES': ['firm_name', 'fund_name', 'management_fee', 'carried_interest', 'start_date'],
-                'INVESTS_IN': ['investor_name', 'investor_type', 'startup_name', 'round_stage', 'round_date', 'amount', 'valuation_pre', 'valuation_post', 'is_lead_investor', 'board_seats', 'equity_percentage'],
-                'PARTICIPATED_IN': ['investor_name', 'investor_type', 'fund_name', 'commitment_amount', 'commitment_date', 'lp_category'],
-                'ACCELERATED_BY': ['startup_name', 'institution_name', 'program_name', 'batch_name', 'start_date', 'end_date', 'equity_taken', 'funding_received', 'demo_day_date'],
-                'ACQUIRED': ['corporate_name', 'startup_name', 'acquisition_date', 'acquisition_value', 'acquisition_type', 'strategic_rationale', 'integration_status'],
-                'PARTNERS_WITH': ['corporate_name', 'partner_name', 'partner_type', 'partnership_type', 'start_date', 'description', 'is_active'],
-                'MENTORS': ['mentor_name', 'mentee_name', 'start_date', 'end_date', 'relationship_type', 'context'],
-                'SPUN_OFF_FROM': ['startup_name', 'parent_name', 'parent_type', 'spinoff_date', 'technology_transferred', 'initial_equity', 'support_provided']
-            }
-            return templates.get(entity_or_relationship, [])
-        
-        return []
+        return list(TEMPLATES.get((data_type, entity_or_relationship), ()))
@@ -1,10 +1,18 @@
-from pydantic import BaseModel, Field, HttpUrl
+import re
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List, Literal
 from datetime import date
 from enum import Enum
 
+try:
+    from enum import StrEnum
+except ImportError:  # Python < 3.11
+    class StrEnum(str, Enum):
+        def __str__(self) -> str:
+            return self.value
+
 # Enums for better type safety
-class PersonRoleType(str, Enum):
+class PersonRoleType(StrEnum):
     FOUNDER = "founder"
     GP = "gp"
     LP = "lp"
@@ -13,7 +21,7 @@ class PersonRoleType(str, Enum):
     ADVISOR = "advisor"
     OTHER = "other"
 
-class StartupStage(str, Enum):
+class StartupStage(StrEnum):
     PRE_SEED = "pre_seed"
     SEED = "seed"
     SERIES_A = "series_a"
@@ -22,31 +30,47 @@ class StartupStage(str, Enum):
     GROWTH = "growth"
     EXIT = "exit"
 
-class StartupStatus(str, Enum):
+class StartupStatus(StrEnum):
     ACTIVE = "active"
     ACQUIRED = "acquired"
     CLOSED = "closed"
     IPO = "ipo"
 
-class VCFirmType(str, Enum):
+class VCFirmType(StrEnum):
     INDEPENDENT = "independent"
     CORPORATE_VC = "corporate_vc"
     GOVERNMENT = "government"
     FAMILY_OFFICE = "family_office"
 
-class InstitutionType(str, Enum):
+class InstitutionType(StrEnum):
     INCUBATOR = "incubator"
     ACCELERATOR = "accelerator"
     VENTURE_BUILDER = "venture_builder"
     UNIVERSITY = "university"
     RESEARCH_CENTER = "research_center"
 
+# Models are only built and dumped, never modified after validation.
+# Schemas are built on first use: most models are never instantiated in a session
+class FrozenModel(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore', validate_assignment=False, defer_build=True)
+
+# URLs are checked with a regex instead of HttpUrl's full parser
+URL_RE = re.compile(r'^https?://\S+$', re.IGNORECASE)
+
+class UrlValidatedModel(FrozenModel):
+    @field_validator('website', 'linkedin_url', mode='after', check_fields=False)
+    @classmethod
+    def check_url(cls, value: Optional[str]) -> Optional[str]:
+        if value is not None and not URL_RE.match(value):
+            raise ValueError("URL must start with http:// or https://")
+        return value
+
 # Entity Models
-class Person(BaseModel):
+class Person(UrlValidatedModel):
     name: str = Field(..., description="Nome completo")
     surname: Optional[str] = Field(None, description="Cognome")
     role_type: PersonRoleType = Field(..., description="Tipo di ruolo primario")
-    linkedin_url: Optional[HttpUrl] = Field(None, description="Profilo LinkedIn")
+    linkedin_url: Optional[str] = Field(None, description="Profilo LinkedIn")
     twitter_handle: Optional[str] = Field(None, description="Handle Twitter/X")
     biography: Optional[str] = Field(None, description="Biografia breve")
     location: Optional[str] = Field(None, description="Città/Regione")
@@ -56,10 +80,10 @@ class Person(BaseModel):
     specialization: Optional[str] = Field(None, description="Settori di specializzazione")
     reputation_score: Optional[int] = Field(None, description="Score reputazione", ge=1, le=100)
 
-class Startup(BaseModel):
+class Startup(UrlValidatedModel):
     name: str = Field(..., description="Nome della startup")
     description: Optional[str] = Field(None, description="Descrizione dell'attività")
-    website: Optional[HttpUrl] = Field(None, description="Sito web")
+    website: Optional[str] = Field(None, description="Sito web")
     founded_year: Optional[int] = Field(None, description="Anno di fondazione", ge=1990, le=2025)
     stage: Optional[StartupStage] = Field(None, description="Fase di sviluppo")
     sector: Optional[str] = Field(None, description="Settore principale")
@@ -72,10 +96,10 @@ class Startup(BaseModel):
     exit_date: Optional[date] = Field(None, description="Data di exit")
     exit_value: Optional[float] = Field(None, description="Valore di exit (€)", ge=0)
 
-class VCFirm(BaseModel):
+class VCFirm(UrlValidatedModel):
     name: str = Field(..., description="Nome della firm")
     description: Optional[str] = Field(None, description="Descrizione della società")
-    website: Optional[HttpUrl] = Field(None, description="Sito web")
+    website: Optional[str] = Field(None, description="Sito web")
     founded_year: Optional[int] = Field(None, description="Anno di fondazione", ge=1900, le=2025)
     headquarters: Optional[str] = Field(None, description="Sede principale")
     type: VCFirmType = Field(..., description="Tipo di firm")
@@ -86,7 +110,7 @@ class VCFirm(BaseModel):
     assets_under_management: Optional[float] = Field(None, description="AUM (€)", ge=0)
     portfolio_companies_count: Optional[int] = Field(None, description="Numero aziende portfolio", ge=0)
 
-class VCFund(BaseModel):
+class VCFund(FrozenModel):
     name: str = Field(..., description="Nome del fondo")
     fund_size: Optional[float] = Field(None, description="Dimensione fondo (€)", ge=0)
     vintage_year: Optional[int] = Field(None, description="Anno di vintage", ge=2000, le=2030)
@@ -101,11 +125,11 @@ class VCFund(BaseModel):
     fund_life: Optional[int] = Field(None, description="Durata fondo (anni)", ge=5, le=15)
     deployed_capital: Optional[float] = Field(None, description="Capitale investito (€)", ge=0)
 
-class AngelSyndicate(BaseModel):
+class AngelSyndicate(UrlValidatedModel):
     name: str = Field(..., description="Nome del syndicate")
     type: Literal["angel_syndicate", "family_office", "crowdfunding_platform", "other"] = Field(..., description="Tipo")
     description: Optional[str] = Field(None, description="Descrizione")
-    website: Optional[HttpUrl] = Field(None, description="Sito web")
+    website: Optional[str] = Field(None, description="Sito web")
     founded_year: Optional[int] = Field(None, description="Anno di fondazione", ge=1990, le=2025)
     headquarters: Optional[str] = Field(None, description="Sede principale")
     members_count: Optional[int] = Field(None, description="Numero membri", ge=1)
@@ -115,11 +139,11 @@ class AngelSyndicate(BaseModel):
     ticket_size_max: Optional[float] = Field(None, description="Ticket massimo (€)", ge=0)
     total_investments: Optional[int] = Field(None, description="Totale investimenti", ge=0)
 
-class Institution(BaseModel):
+class Institution(UrlValidatedModel):
     name: str = Field(..., description="Nome dell'istituzione")
     type: InstitutionType = Field(..., description="Tipo di istituzione")
     description: Optional[str] = Field(None, description="Descrizione attività")
-    website: Optional[HttpUrl] = Field(None, description="Sito web")
+    website: Optional[str] = Field(None, description="Sito web")
     founded_year: Optional[int] = Field(None, description="Anno di fondazione", ge=1900, le=2025)
     headquarters: Optional[str] = Field(None, description="Sede principale")
     program_duration: Optional[int] = Field(None, description="Durata programma (mesi)", ge=1, le=24)
@@ -130,10 +154,10 @@ class Institution(BaseModel):
     portfolio_companies_count: Optional[int] = Field(None, description="Aziende supportate", ge=0)
     success_rate: Optional[float] = Field(None, description="Tasso di successo (%)", ge=0, le=100)
 
-class Corporate(BaseModel):
+class Corporate(UrlValidatedModel):
     name: str = Field(..., description="Nome dell'azienda")
     description: Optional[str] = Field(None, description="Descrizione attività")
-    website: Optional[HttpUrl] = Field(None, description="Sito web")
+    website: Optional[str] = Field(None, description="Sito web")
     founded_year: Optional[int] = Field(None, description="Anno di fondazione", ge=1800, le=2025)
     headquarters: Optional[str] = Field(None, description="Sede principale")
     sector: Optional[str] = Field(None, description="Settore principale")
@@ -146,7 +170,7 @@ class Corporate(BaseModel):
     innovation_programs: bool = Field(False, description="Ha programmi innovazione")
 
 # Relationship Models
-class Investment(BaseModel):
+class Investment(FrozenModel):
     round_stage: StartupStage = Field(..., description="Stage del round")
     round_date: date = Field(..., description="Data del round")
     amount: float = Field(..., description="Importo investito (€)", ge=0)
@@ -156,38 +180,38 @@ class Investment(BaseModel):
     board_seats: Optional[int] = Field(None, description="Posti CdA ottenuti", ge=0)
     equity_percentage: Optional[float] = Field(None, description="% equity ottenuta", ge=0, le=100)
 
-class AngelInvestment(BaseModel):
+class AngelInvestment(FrozenModel):
     investment_date: date = Field(..., description="Data investimento")
     round_stage: StartupStage = Field(..., description="Stage del round")
     amount: float = Field(..., description="Importo investito (€)", ge=0)
     lead_investor: bool = Field(False, description="È lead investor")
     board_seat: bool = Field(False, description="Ha posto in CdA")
 
-class Employment(BaseModel):
+class Employment(FrozenModel):
     role: str = Field(..., description="Ruolo")
     start_date: date = Field(..., description="Data inizio")
     end_date: Optional[date] = Field(None, description="Data fine")
     seniority_level: Optional[str] = Field(None, description="Livello seniority")
     is_current: bool = Field(True, description="È ancora attivo")
 
-class FundManagement(BaseModel):
+class FundManagement(FrozenModel):
     management_fee: Optional[float] = Field(None, description="Fee di gestione (%)", ge=0, le=10)
     carried_interest: Optional[float] = Field(None, description="Carried interest (%)", ge=0, le=50)
     start_date: date = Field(..., description="Data inizio gestione")
 
-class Founding(BaseModel):
+class Founding(FrozenModel):
     role: str = Field(..., description="Ruolo nella fondazione (CEO, CTO, Co-founder)")
     founding_date: date = Field(..., description="Data di fondazione")
     equity_percentage: Optional[float] = Field(None, description="% equity iniziale", ge=0, le=100)
     is_current: bool = Field(True, description="È ancora attivo nella startup")
     exit_date: Optional[date] = Field(None, description="Data di uscita dalla startup")
 
-class LPParticipation(BaseModel):
+class LPParticipation(FrozenModel):
     commitment_amount: float = Field(..., description="Importo committed (€)", gt=0)
     commitment_date: date = Field(..., description="Data del commitment")
     investor_type: str = Field(..., description="Tipo di investitore (institutional, hnwi, family_office, etc.)")
 
-class Acceleration(BaseModel):
+class Acceleration(FrozenModel):
     program_name: str = Field(..., description="Nome del programma")
     batch_name: Optional[str] = Field(None, description="Nome del batch")
     start_date: date = Field(..., description="Data inizio programma")
@@ -196,26 +220,26 @@ class Acceleration(BaseModel):
     funding_received: Optional[float] = Field(None, description="Finanziamento ricevuto (€)", ge=0)
     demo_day_date: Optional[date] = Field(None, description="Data demo day")
 
-class Acquisition(BaseModel):
+class Acquisition(FrozenModel):
     acquisition_date: date = Field(..., description="Data acquisizione")
     acquisition_value: Optional[float] = Field(None, description="Valore acquisizione (€)", gt=0)
     acquisition_type: str = Field(..., description="Tipo (full_acquisition, majority_stake, minority_stake)")
     strategic_rationale: Optional[str] = Field(None, description="Razionale strategico")
     integration_status: Optional[str] = Field(None, description="Stato integrazione")
 
-class Partnership(BaseModel):
+class Partnership(FrozenModel):
     partnership_type: str = Field(..., description="Tipo (strategic, commercial, investment, program)")
     start_date: date = Field(..., description="Data inizio partnership")
     description: Optional[str] = Field(None, description="Descrizione della partnership")
     is_active: bool = Field(True, description="Partnership ancora attiva")
 
-class Mentorship(BaseModel):
+class Mentorship(FrozenModel):
     start_date: date = Field(..., description="Data inizio mentorship")
     end_date: Optional[date] = Field(None, description="Data fine (se applicabile)")
     relationship_type: str = Field(..., description="Tipo (formal_mentor, advisor, informal)")
     context: Optional[str] = Field(None, description="Contesto della relazione")
 
-class SpinOff(BaseModel):
+class SpinOff(FrozenModel):
     spinoff_date: date = Field(..., description="Data dello spin-off")
     technology_transferred: Optional[str] = Field(None, description="Tecnologia trasferita")
     initial_equity: Optional[float] = Field(None, description="Equity iniziale mantenuta dalla parent", ge=0, le=100)
@@ -1,6 +1,13 @@
 import os
-from typing import Optional, Dict, List, Any
-from neo4j import GraphDatabase, Driver
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partial, wraps
+from typing import Optional, Dict, List, Any, Iterator
+from neo4j import GraphDatabase, AsyncGraphDatabase, AsyncDriver, Driver, Session, Transaction
+from neo4j.time import Date
 from dotenv import load_dotenv
 import logging
 
@@ -9,30 +16,297 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Read-only query results are reused for this many seconds, up to this many distinct queries
+READ_CACHE_TTL = 60
+READ_CACHE_SIZE = 1024
+
+def invalidates_read_cache(method):
+    """Clear the repository's read cache after a method that writes to the graph"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.invalidate_read_cache()
+    return wrapper
+
+# Batch MERGE queries per entity type, each row of $rows is one node shaped by entity_rows()
+PERSON_BATCH_QUERY = """
+UNWIND $rows AS row
+MERGE (p:Person {name: row.name, surname: row.surname})
+ON CREATE SET p += row.props, p.id = randomUUID(), p.created_at = datetime(), p.updated_at = datetime()
+ON MATCH SET p += row.props, p.updated_at = datetime()
+RETURN count(p) AS written
+"""
+
+STARTUP_BATCH_QUERY = """
+UNWIND $rows AS row
+MERGE (s:Startup {name: row.name})
+ON CREATE SET s += row.props, s.id = randomUUID(), s.created_at = datetime(), s.updated_at = datetime()
+ON MATCH SET s += row.props, s.updated_at = datetime()
+RETURN count(s) AS written
+"""
+
+VC_FIRM_BATCH_QUERY = """
+UNWIND $rows AS row
+MERGE (f:VC_Firm {name: row.name})
+ON CREATE SET f += row.props, f.id = randomUUID(), f.created_at = datetime(), f.updated_at = datetime()
+ON MATCH SET f += row.props, f.updated_at = datetime()
+RETURN count(f) AS written
+"""
+
+VC_FUND_BATCH_QUERY = """
+UNWIND $rows AS row
+MERGE (f:VC_Fund {name: row.name})
+ON CREATE SET f += row.props, f.id = randomUUID(), f.created_at = datetime(), f.updated_at = datetime()
+ON MATCH SET f += row.props, f.updated_at = datetime()
+RETURN count(f) AS written
+"""
+
+ANGEL_SYNDICATE_BATCH_QUERY = """
+UNWIND $rows AS row
+MERGE (a:Angel_Syndicate {name: row.name})
+ON CREATE SET a += row.props, a.id = randomUUID(), a.created_at = datetime(), a.updated_at = datetime()
+ON MATCH SET a += row.props, a.updated_at = datetime()
+RETURN count(a) AS written
+"""
+
+INSTITUTION_BATCH_QUERY = """
+UNWIND $rows AS row
+MERGE (i:Institution {name: row.name})
+ON CREATE SET i += row.props, i.id = randomUUID(), i.created_at = datetime(), i.updated_at = datetime()
+ON MATCH SET i += row.props, i.updated_at = datetime()
+RETURN count(i) AS written
+"""
+
+CORPORATE_BATCH_QUERY = """
+UNWIND $rows AS row
+MERGE (c:Corporate {name: row.name})
+ON CREATE SET c += row.props, c.id = randomUUID(), c.created_at = datetime(), c.updated_at = datetime()
+ON MATCH SET c += row.props, c.updated_at = datetime()
+RETURN count(c) AS written
+"""
+
+# Batch MERGE query for FOUNDED relationships, a null date keeps the stored one (as entity_rows does for nodes)
+FOUNDED_BATCH_QUERY = """
+UNWIND $rows AS row
+MATCH (person:Person {name: row.person_name, surname: row.person_surname})
+MATCH (startup:Startup {name: row.startup_name})
+MERGE (person)-[r:FOUNDED]->(startup)
+SET 
+    r.role = row.role,
+    r.founding_date = coalesce(row.founding_date, r.founding_date),
+    r.equity_percentage = row.equity_percentage,
+    r.is_current = row.is_current,
+    r.exit_date = coalesce(row.exit_date, r.exit_date)
+RETURN count(r) AS written
+"""
+
+ENTITY_BATCH_QUERIES = {
+    'Person': PERSON_BATCH_QUERY,
+    'Startup': STARTUP_BATCH_QUERY,
+    'VC_Firm': VC_FIRM_BATCH_QUERY,
+    'VC_Fund': VC_FUND_BATCH_QUERY,
+    'Angel_Syndicate': ANGEL_SYNDICATE_BATCH_QUERY,
+    'Institution': INSTITUTION_BATCH_QUERY,
+    'Corporate': CORPORATE_BATCH_QUERY
+}
+
+# Labels that may be interpolated into Cypher (labels cannot be query parameters)
+ENTITY_LABELS = frozenset(ENTITY_BATCH_QUERIES)
+
+# Keys every entity is MERGEd on, enforced as uniqueness constraints at connect time so MERGE is an index seek
+UNIQUE_KEYS = {
+    'Person': ('name', 'surname'),
+    'Startup': ('name',),
+    'VC_Firm': ('name',),
+    'VC_Fund': ('name',),
+    'Angel_Syndicate': ('name',),
+    'Institution': ('name',),
+    'Corporate': ('name',)
+}
+
+# Schema lookups used by ensure_schema (owningConstraint needs Neo4j 5)
+CONSTRAINT_EXISTS_QUERY = """
+SHOW CONSTRAINTS YIELD name
+WHERE name = $name
+RETURN name
+"""
+
+# Range indexes on exactly these node keys that no constraint owns
+PLAIN_INDEX_QUERY = """
+SHOW INDEXES YIELD name, type, entityType, labelsOrTypes, properties, owningConstraint
+WHERE type = 'RANGE' AND entityType = 'NODE' AND owningConstraint IS NULL
+    AND labelsOrTypes = [$label] AND properties = $properties
+RETURN name
+"""
+
+# Duplicate nodes deleted per transaction by clean_duplicates
+DUPLICATE_BATCH_SIZE = 1000
+
+# Relationship properties indexed at connect time
+RELATIONSHIP_INDEXES = {
+    'INVESTS_IN': ('round_date',)
+}
+
+def checked_label(label: str) -> str:
+    """Return label if it is an entity label, otherwise raise ValueError instead of building the query"""
+    if label not in ENTITY_LABELS:
+        raise ValueError(f"Unknown entity label: {label!r}")
+    return label
+
+# Date properties of the batch queries, sent as dates so the queries need no date() call
+ENTITY_DATE_FIELDS = {
+    'Startup': ('last_funding_date', 'exit_date'),
+    'VC_Fund': ('first_close_date', 'final_close_date')
+}
+FOUNDED_DATE_FIELDS = ('founding_date', 'exit_date')
+
+# Properties each entity batch query writes through SET += row.props, besides its UNIQUE_KEYS
+ENTITY_PROPERTIES = {
+    'Person': (
+        'role_type', 'linkedin_url', 'twitter_handle', 'biography', 'location', 'birth_year', 'education',
+        'previous_experience', 'specialization', 'reputation_score'
+    ),
+    'Startup': (
+        'description', 'website', 'founded_year', 'stage', 'sector', 'business_model', 'headquarters',
+        'employee_count', 'status', 'total_funding', 'last_funding_date', 'exit_date', 'exit_value'
+    ),
+    'VC_Firm': (
+        'description', 'website', 'founded_year', 'headquarters', 'type', 'investment_focus', 'stage_focus',
+        'geographic_focus', 'team_size', 'assets_under_management', 'portfolio_companies_count'
+    ),
+    'VC_Fund': (
+        'fund_size', 'vintage_year', 'fund_number', 'status', 'target_sectors', 'target_stages',
+        'geographic_focus', 'first_close_date', 'final_close_date', 'investment_period', 'fund_life',
+        'deployed_capital'
+    ),
+    'Angel_Syndicate': (
+        'type', 'description', 'website', 'founded_year', 'headquarters', 'members_count',
+        'investment_focus', 'stage_focus', 'ticket_size_min', 'ticket_size_max', 'total_investments'
+    ),
+    'Institution': (
+        'type', 'description', 'website', 'founded_year', 'headquarters', 'program_duration', 'batch_size',
+        'sectors_focus', 'equity_taken', 'funding_provided', 'portfolio_companies_count', 'success_rate'
+    ),
+    'Corporate': (
+        'description', 'website', 'founded_year', 'headquarters', 'sector', 'industry', 'size', 'revenue',
+        'employee_count', 'stock_exchange', 'ticker', 'has_cvc_arm', 'innovation_programs'
+    )
+}
+
+def _as_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    return Date.from_iso_format(value) if value else None
+
+def coerce_dates(rows: List[Dict], fields) -> List[Dict]:
+    """Return rows with the values in fields as dates: ISO strings become neo4j Dates ('' becomes None),
+    datetimes their date, anything else is untouched"""
+    coerced = []
+    for row in rows:
+        changed = {field: _as_date(row[field]) for field in fields if isinstance(row.get(field), (str, datetime))}
+        if changed:
+            row = {**row, **changed}
+        coerced.append(row)
+    return coerced
+
+def entity_rows(entity_type: str, rows: List[Dict]) -> List[Dict]:
+    """Shape rows for ENTITY_BATCH_QUERIES: the MERGE keys at the top level, the other known fields in a props map.
+    
+    Only fields present in a row are written, and null dates are left out so an update keeps the stored date.
+    """
+    keys = UNIQUE_KEYS[entity_type]
+    properties = ENTITY_PROPERTIES[entity_type]
+    date_fields = ENTITY_DATE_FIELDS.get(entity_type, ())
+    shaped = []
+    for row in coerce_dates(rows, date_fields):
+        props = {
+            field: row[field] for field in properties
+            if field in row and not (field in date_fields and row[field] is None)
+        }
+        shaped.append({**{key: row.get(key) for key in keys}, 'props': props})
+    return shaped
+
 class Neo4jConnection:
     def __init__(self):
         self.uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
         self.user = os.getenv("NEO4J_USER", "neo4j")
         self.password = os.getenv("NEO4J_PASSWORD", "")
         self.database = os.getenv("NEO4J_DATABASE", "neo4j")
+        # Pool sized for the importer's concurrent writers, a saturated pool fails after the timeout (seconds)
+        self.max_pool_size = int(os.getenv("NEO4J_MAX_POOL_SIZE", "100"))
+        self.acquisition_timeout = float(os.getenv("NEO4J_ACQUISITION_TIMEOUT", "30"))
         self.driver: Optional[Driver] = None
+        # driver.session bound to the configured database, set by connect()
+        self._session_factory = None
+        # Transaction opened by transaction() on the current thread, if any
+        self._local = threading.local()
         
     def connect(self):
         """Establish connection to Neo4j database"""
         try:
             self.driver = GraphDatabase.driver(
                 self.uri, 
-                auth=(self.user, self.password)
+                auth=(self.user, self.password),
+                max_connection_pool_size=self.max_pool_size,
+                connection_acquisition_timeout=self.acquisition_timeout
             )
+            self._session_factory = partial(self.driver.session, database=self.database)
             # Test connection
             with self.driver.session() as session:
                 session.run("RETURN 1")
             logger.info("Successfully connected to Neo4j")
+            self.ensure_schema()
             return True
         except Exception as e:
             logger.error(f"Failed to connect to Neo4j: {e}")
             return False
     
+    def ensure_schema(self):
+        """Create the uniqueness constraints and relationship indexes if missing (idempotent).
+        
+        While a label has duplicate keys its constraint cannot exist, so a plain index on the keys is kept
+        instead and the constraint is retried on the next connect (after clean_duplicates, say). A plain index
+        blocks the constraint, so it is only dropped right before the constraint is created.
+        """
+        for label, properties in UNIQUE_KEYS.items():
+            name = f"{label.lower()}_{'_'.join(properties)}_unique"
+            index_name = f"{label.lower()}_{'_'.join(properties)}"
+            columns = ', '.join(f"n.{prop}" for prop in properties)
+            try:
+                if self.execute_query(CONSTRAINT_EXISTS_QUERY, {'name': name}):
+                    continue
+                
+                # Nodes missing a key are ignored by the constraint, so they are not duplicates either
+                present = ' AND '.join(f"n.{prop} IS NOT NULL" for prop in properties)
+                duplicates = self.execute_query(
+                    f"MATCH (n:{label}) WHERE {present} WITH [{columns}] AS dedup_key, count(*) AS copies "
+                    f"WHERE copies > 1 RETURN 1 LIMIT 1"
+                )
+                if duplicates:
+                    logger.warning(f"Duplicate {label} nodes, keeping a plain index instead of {name}")
+                    self.execute_query(f"CREATE INDEX {index_name} IF NOT EXISTS FOR (n:{label}) ON ({columns})")
+                    continue
+                
+                for record in self.execute_query(PLAIN_INDEX_QUERY, {'label': label, 'properties': list(properties)}):
+                    self.execute_query(f"DROP INDEX `{record['name']}` IF EXISTS")
+                self.execute_query(f"CREATE CONSTRAINT {name} IF NOT EXISTS FOR (n:{label}) REQUIRE ({columns}) IS UNIQUE")
+            except Exception as e:
+                logger.warning(f"Could not create {name}, falling back to a plain index: {e}")
+                try:
+                    self.execute_query(f"CREATE INDEX {index_name} IF NOT EXISTS FOR (n:{label}) ON ({columns})")
+                except Exception as e:
+                    logger.warning(f"Could not create {index_name}: {e}")
+        
+        for rel_type, properties in RELATIONSHIP_INDEXES.items():
+            name = f"{rel_type.lower()}_{'_'.join(properties)}"
+            columns = ', '.join(f"r.{prop}" for prop in properties)
+            try:
+                self.execute_query(f"CREATE INDEX {name} IF NOT EXISTS FOR ()-[r:{rel_type}]-() ON ({columns})")
+            except Exception as e:
+                logger.warning(f"Could not create {name}: {e}")
+    
     def close(self):
         """Close Neo4j connection"""
         if self.driver:
@@ -45,9 +319,105 @@ class Neo4jConnection:
             raise Exception("Not connected to database")
         
         try:
-            with self.driver.session(database=self.database) as session:
-                result = session.run(query, parameters or {})
-                return [record.data() for record in result]
+            # run() accepts None and copies the parameters itself
+            tx = getattr(self._local, 'tx', None)
+            if tx is not None:
+                result = tx.run(query, parameters)
+                return result.data()
+            
+            with self._session_factory() as session:
+                result = session.run(query, parameters)
+                return result.data()
+        except Exception as e:
+            logger.error(f"Query execution failed: {e}")
+            raise
+    
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """Hold one session (and its pooled connection) across several queries"""
+        if not self.driver:
+            raise Exception("Not connected to database")
+        
+        with self._session_factory() as session:
+            yield session
+    
+    @contextmanager
+    def transaction(self) -> Iterator[Transaction]:
+        """Route every execute_query of this thread through one explicit transaction.
+        
+        The transaction is committed when the block exits normally and rolled back if it raises.
+        """
+        if getattr(self._local, 'tx', None) is not None:
+            # Already inside a transaction, join it
+            yield self._local.tx
+            return
+        
+        with self.session_scope() as session:
+            with session.begin_transaction() as tx:
+                self._local.tx = tx
+                try:
+                    yield tx
+                finally:
+                    self._local.tx = None
+    
+    def in_transaction(self) -> bool:
+        """Whether execute_query on this thread currently runs inside transaction()"""
+        return getattr(self._local, 'tx', None) is not None
+    
+    def create_async_connection(self) -> 'AsyncNeo4jConnection':
+        """Create an async connection to the same database (connect and close it on the loop that uses it)"""
+        return AsyncNeo4jConnection(self.uri, self.user, self.password, self.database,
+                                    self.max_pool_size, self.acquisition_timeout)
+
+class AsyncNeo4jConnection:
+    """Async counterpart of Neo4jConnection, on neo4j.AsyncGraphDatabase.
+    
+    Async drivers are bound to the event loop they are used on, so the connection is created per
+    event loop (see Neo4jConnection.create_async_connection) and closed before that loop ends.
+    """
+    def __init__(self, uri: str, user: str, password: str, database: str,
+                 max_pool_size: int = 100, acquisition_timeout: float = 30.0):
+        self.uri = uri
+        self.user = user
+        self.password = password
+        self.database = database
+        self.max_pool_size = max_pool_size
+        self.acquisition_timeout = acquisition_timeout
+        self.driver: Optional[AsyncDriver] = None
+    
+    async def connect(self):
+        """Establish connection to Neo4j database"""
+        try:
+            self.driver = AsyncGraphDatabase.driver(
+                self.uri, 
+                auth=(self.user, self.password),
+                max_connection_pool_size=self.max_pool_size,
+                connection_acquisition_timeout=self.acquisition_timeout
+            )
+            # Test connection
+            async with self.driver.session(database=self.database) as session:
+                await session.run("RETURN 1")
+            logger.info("Successfully connected to Neo4j (async)")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to connect to Neo4j: {e}")
+            return False
+    
+    async def close(self):
+        """Close Neo4j connection"""
+        if self.driver:
+            await self.driver.close()
+            logger.info("Neo4j async connection closed")
+    
+    async def execute_query(self, query: str, parameters: Dict = None) -> List[Dict]:
+        """Execute a Cypher query and return results"""
+        if not self.driver:
+            raise Exception("Not connected to database")
+        
+        try:
+            async with self.driver.session(database=self.database) as session:
+                result = await session.run(query, parameters)
+                return await result.data()
         except Exception as e:
             logger.error(f"Query execution failed: {e}")
             raise
@@ -55,372 +425,249 @@ class Neo4jConnection:
 class Neo4jRepository:
     def __init__(self, connection: Neo4jConnection):
         self.connection = connection
+        self._ensured_indexes = set()
+        # (query, parameters) -> (expiry, result), shared by every UI session using this repository
+        self._read_cache = OrderedDict()
+        self._read_cache_lock = threading.Lock()
+        self._read_cache_generation = 0
+    
+    @contextmanager
+    def batch(self) -> Iterator[Transaction]:
+        """Run the repository calls made inside the with-block in a single transaction:
+        
+            with repo.batch():
+                repo.create_person(...)
+                repo.create_founded_relationship(...)
+        
+        The read cache is cleared again once the transaction has committed or rolled back.
+        """
+        try:
+            with self.connection.transaction() as tx:
+                yield tx
+        finally:
+            # Reads cached by other sessions before the commit may hold the old data
+            self.invalidate_read_cache()
+    
+    # --- READ CACHE ---
+    
+    def _cached_query(self, query: str, parameters: Dict = None) -> List[Dict]:
+        """execute_query for read-only queries, reusing the result of an identical query for READ_CACHE_TTL seconds"""
+        if self.connection.in_transaction():
+            # Inside batch() the query sees uncommitted writes, which must not be shared
+            return self.connection.execute_query(query, parameters)
+        
+        key = (query, tuple(sorted((parameters or {}).items())))
+        now = time.monotonic()
+        with self._read_cache_lock:
+            entry = self._read_cache.get(key)
+            if entry is not None and entry[0] > now:
+                self._read_cache.move_to_end(key)
+                return entry[1]
+            generation = self._read_cache_generation
+        
+        result = self.connection.execute_query(query, parameters)
+        
+        with self._read_cache_lock:
+            # A write that ran meanwhile may have made this result stale
+            if generation == self._read_cache_generation:
+                self._read_cache[key] = (now + READ_CACHE_TTL, result)
+                self._read_cache.move_to_end(key)
+                while len(self._read_cache) > READ_CACHE_SIZE:
+                    self._read_cache.popitem(last=False)
+        return result
+    
+    def invalidate_read_cache(self):
+        """Drop every cached read, called after writes"""
+        with self._read_cache_lock:
+            self._read_cache.clear()
+            self._read_cache_generation += 1
+    
+    # --- SCHEMA METHODS ---
+    
+    def ensure_index(self, label: str, *properties: str) -> bool:
+        """Create a range index on label(properties) if missing, so MERGE/MATCH on those keys avoid label scans"""
+        label = checked_label(label)
+        key = (label, properties)
+        if key in self._ensured_indexes or UNIQUE_KEYS.get(label) == properties:
+            # Keys in UNIQUE_KEYS are covered by Neo4jConnection.ensure_schema, another index would block the constraint
+            return True
+        
+        index_name = f"{label.lower()}_{'_'.join(properties)}"
+        columns = ', '.join(f"n.{prop}" for prop in properties)
+        query = f"CREATE INDEX {index_name} IF NOT EXISTS FOR (n:{label}) ON ({columns})"
+        try:
+            self.connection.execute_query(query)
+            self._ensured_indexes.add(key)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create index {index_name}: {e}")
+            return False
+    
+    # --- BATCH HELPERS ---
+    
+    @invalidates_read_cache
+    def _write_batch(self, query: str, rows: List[Dict]) -> int:
+        """Run an UNWIND $rows batch query, returns the 'written' count it reports"""
+        result = self.connection.execute_query(query, {'rows': rows})
+        return result[0]['written'] if result else 0
+    
+    async def create_entities_batch_async(self, connection: AsyncNeo4jConnection, entity_type: str,
+                                          rows: List[Dict]) -> int:
+        """Async counterpart of create_<type>_batch, on a connection from Neo4jConnection.create_async_connection()"""
+        try:
+            result = await connection.execute_query(ENTITY_BATCH_QUERIES[entity_type], {'rows': entity_rows(entity_type, rows)})
+            return result[0]['written'] if result else 0
+        finally:
+            self.invalidate_read_cache()
     
     # --- ENTITY CREATION METHODS ---
     
     def create_person(self, person_data: Dict) -> bool:
         """Create a Person node (uses MERGE to avoid duplicates by name and surname)"""
-        query = """
-        MERGE (p:Person {name: $name, surname: $surname})
-        ON CREATE SET 
-            p.id = randomUUID(),
-            p.role_type = $role_type,
-            p.linkedin_url = $linkedin_url,
-            p.twitter_handle = $twitter_handle,
-            p.biography = $biography,
-            p.location = $location,
-            p.birth_year = $birth_year,
-            p.education = $education,
-            p.previous_experience = $previous_experience,
-            p.specialization = $specialization,
-            p.reputation_score = $reputation_score,
-            p.created_at = datetime(),
-            p.updated_at = datetime()
-        ON MATCH SET
-            p.role_type = $role_type,
-            p.linkedin_url = $linkedin_url,
-            p.twitter_handle = $twitter_handle,
-            p.biography = $biography,
-            p.location = $location,
-            p.birth_year = $birth_year,
-            p.education = $education,
-            p.previous_experience = $previous_experience,
-            p.specialization = $specialization,
-            p.reputation_score = $reputation_score,
-            p.updated_at = datetime()
-        RETURN p.id as id
-        """
         try:
-            result = self.connection.execute_query(query, person_data)
-            return len(result) > 0
+            return self.create_person_batch([person_data]) > 0
         except Exception as e:
             logger.error(f"Failed to create person: {e}")
             return False
     
+    def create_person_batch(self, rows: List[Dict]) -> int:
+        """Create or update a batch of Person nodes with a single UNWIND + MERGE (by name and surname), returns rows written"""
+        return self._write_batch(PERSON_BATCH_QUERY, entity_rows('Person', rows))
+    
     def create_startup(self, startup_data: Dict) -> bool:
         """Create a Startup node (uses MERGE to avoid duplicates by name)"""
-        query = """
-        MERGE (s:Startup {name: $name})
-        ON CREATE SET 
-            s.id = randomUUID(),
-            s.description = $description,
-            s.website = $website,
-            s.founded_year = $founded_year,
-            s.stage = $stage,
-            s.sector = $sector,
-            s.business_model = $business_model,
-            s.headquarters = $headquarters,
-            s.employee_count = $employee_count,
-            s.status = $status,
-            s.total_funding = $total_funding,
-            s.last_funding_date = date($last_funding_date),
-            s.exit_date = date($exit_date),
-            s.exit_value = $exit_value,
-            s.created_at = datetime(),
-            s.updated_at = datetime()
-        ON MATCH SET
-            s.description = $description,
-            s.website = $website,
-            s.founded_year = $founded_year,
-            s.stage = $stage,
-            s.sector = $sector,
-            s.business_model = $business_model,
-            s.headquarters = $headquarters,
-            s.employee_count = $employee_count,
-            s.status = $status,
-            s.total_funding = $total_funding,
-            s.last_funding_date = CASE WHEN $last_funding_date IS NOT NULL THEN date($last_funding_date) ELSE s.last_funding_date END,
-            s.exit_date = CASE WHEN $exit_date IS NOT NULL THEN date($exit_date) ELSE s.exit_date END,
-            s.exit_value = $exit_value,
-            s.updated_at = datetime()
-        RETURN s.id as id
-        """
         try:
-            # Convert date strings to Neo4j date format
-            if startup_data.get('last_funding_date'):
-                startup_data['last_funding_date'] = str(startup_data['last_funding_date'])
-            if startup_data.get('exit_date'):
-                startup_data['exit_date'] = str(startup_data['exit_date'])
-                
-            result = self.connection.execute_query(query, startup_data)
-            return len(result) > 0
+            return self.create_startup_batch([startup_data]) > 0
         except Exception as e:
             logger.error(f"Failed to create startup: {e}")
             return False
     
+    def create_startup_batch(self, rows: List[Dict]) -> int:
+        """Create or update a batch of Startup nodes with a single UNWIND + MERGE (by name), returns rows written"""
+        return self._write_batch(STARTUP_BATCH_QUERY, entity_rows('Startup', rows))
+    
     def create_vc_firm(self, firm_data: Dict) -> bool:
         """Create a VC_Firm node (uses MERGE to avoid duplicates by name)"""
-        query = """
-        MERGE (f:VC_Firm {name: $name})
-        ON CREATE SET 
-            f.id = randomUUID(),
-            f.description = $description,
-            f.website = $website,
-            f.founded_year = $founded_year,
-            f.headquarters = $headquarters,
-            f.type = $type,
-            f.investment_focus = $investment_focus,
-            f.stage_focus = $stage_focus,
-            f.geographic_focus = $geographic_focus,
-            f.team_size = $team_size,
-            f.assets_under_management = $assets_under_management,
-            f.portfolio_companies_count = $portfolio_companies_count,
-            f.created_at = datetime(),
-            f.updated_at = datetime()
-        ON MATCH SET
-            f.description = $description,
-            f.website = $website,
-            f.founded_year = $founded_year,
-            f.headquarters = $headquarters,
-            f.type = $type,
-            f.investment_focus = $investment_focus,
-            f.stage_focus = $stage_focus,
-            f.geographic_focus = $geographic_focus,
-            f.team_size = $team_size,
-            f.assets_under_management = $assets_under_management,
-            f.portfolio_companies_count = $portfolio_companies_count,
-            f.updated_at = datetime()
-        RETURN f.id as id
-        """
         try:
-            result = self.connection.execute_query(query, firm_data)
-            return len(result) > 0
+            return self.create_vc_firm_batch([firm_data]) > 0
         except Exception as e:
             logger.error(f"Failed to create VC firm: {e}")
             return False
     
+    def create_vc_firm_batch(self, rows: List[Dict]) -> int:
+        """Create or update a batch of VC_Firm nodes with a single UNWIND + MERGE (by name), returns rows written"""
+        return self._write_batch(VC_FIRM_BATCH_QUERY, entity_rows('VC_Firm', rows))
+    
     def create_vc_fund(self, fund_data: Dict) -> bool:
         """Create a VC_Fund node (uses MERGE to avoid duplicates by name)"""
-        query = """
-        MERGE (f:VC_Fund {name: $name})
-        ON CREATE SET 
-            f.id = randomUUID(),
-            f.fund_size = $fund_size,
-            f.vintage_year = $vintage_year,
-            f.fund_number = $fund_number,
-            f.status = $status,
-            f.target_sectors = $target_sectors,
-            f.target_stages = $target_stages,
-            f.geographic_focus = $geographic_focus,
-            f.first_close_date = date($first_close_date),
-            f.final_close_date = date($final_close_date),
-            f.investment_period = $investment_period,
-            f.fund_life = $fund_life,
-            f.deployed_capital = $deployed_capital,
-            f.created_at = datetime(),
-            f.updated_at = datetime()
-        ON MATCH SET
-            f.fund_size = $fund_size,
-            f.vintage_year = $vintage_year,
-            f.fund_number = $fund_number,
-            f.status = $status,
-            f.target_sectors = $target_sectors,
-            f.target_stages = $target_stages,
-            f.geographic_focus = $geographic_focus,
-            f.first_close_date = CASE WHEN $first_close_date IS NOT NULL THEN date($first_close_date) ELSE f.first_close_date END,
-            f.final_close_date = CASE WHEN $final_close_date IS NOT NULL THEN date($final_close_date) ELSE f.final_close_date END,
-            f.investment_period = $investment_period,
-            f.fund_life = $fund_life,
-            f.deployed_capital = $deployed_capital,
-            f.updated_at = datetime()
-        RETURN f.id as id
-        """
         try:
-            # Convert date strings to Neo4j date format
-            if fund_data.get('first_close_date'):
-                fund_data['first_close_date'] = str(fund_data['first_close_date'])
-            if fund_data.get('final_close_date'):
-                fund_data['final_close_date'] = str(fund_data['final_close_date'])
-                
-            result = self.connection.execute_query(query, fund_data)
-            return len(result) > 0
+            return self.create_vc_fund_batch([fund_data]) > 0
         except Exception as e:
             logger.error(f"Failed to create VC fund: {e}")
             return False
     
+    def create_vc_fund_batch(self, rows: List[Dict]) -> int:
+        """Create or update a batch of VC_Fund nodes with a single UNWIND + MERGE (by name), returns rows written"""
+        return self._write_batch(VC_FUND_BATCH_QUERY, entity_rows('VC_Fund', rows))
+    
     def create_angel_syndicate(self, syndicate_data: Dict) -> bool:
         """Create an Angel_Syndicate node (uses MERGE to avoid duplicates by name)"""
-        query = """
-        MERGE (a:Angel_Syndicate {name: $name})
-        ON CREATE SET 
-            a.id = randomUUID(),
-            a.type = $type,
-            a.description = $description,
-            a.website = $website,
-            a.founded_year = $founded_year,
-            a.headquarters = $headquarters,
-            a.members_count = $members_count,
-            a.investment_focus = $investment_focus,
-            a.stage_focus = $stage_focus,
-            a.ticket_size_min = $ticket_size_min,
-            a.ticket_size_max = $ticket_size_max,
-            a.total_investments = $total_investments,
-            a.created_at = datetime(),
-            a.updated_at = datetime()
-        ON MATCH SET
-            a.type = $type,
-            a.description = $description,
-            a.website = $website,
-            a.founded_year = $founded_year,
-            a.headquarters = $headquarters,
-            a.members_count = $members_count,
-            a.investment_focus = $investment_focus,
-            a.stage_focus = $stage_focus,
-            a.ticket_size_min = $ticket_size_min,
-            a.ticket_size_max = $ticket_size_max,
-            a.total_investments = $total_investments,
-            a.updated_at = datetime()
-        RETURN a.id as id
-        """
         try:
-            result = self.connection.execute_query(query, syndicate_data)
-            return len(result) > 0
+            return self.create_angel_syndicate_batch([syndicate_data]) > 0
         except Exception as e:
             logger.error(f"Failed to create angel syndicate: {e}")
             return False
     
+    def create_angel_syndicate_batch(self, rows: List[Dict]) -> int:
+        """Create or update a batch of Angel_Syndicate nodes with a single UNWIND + MERGE (by name), returns rows written"""
+        return self._write_batch(ANGEL_SYNDICATE_BATCH_QUERY, entity_rows('Angel_Syndicate', rows))
+    
     def create_institution(self, institution_data: Dict) -> bool:
         """Create an Institution node (uses MERGE to avoid duplicates by name)"""
-        query = """
-        MERGE (i:Institution {name: $name})
-        ON CREATE SET 
-            i.id = randomUUID(),
-            i.type = $type,
-            i.description = $description,
-            i.website = $website,
-            i.founded_year = $founded_year,
-            i.headquarters = $headquarters,
-            i.program_duration = $program_duration,
-            i.batch_size = $batch_size,
-            i.sectors_focus = $sectors_focus,
-            i.equity_taken = $equity_taken,
-            i.funding_provided = $funding_provided,
-            i.portfolio_companies_count = $portfolio_companies_count,
-            i.success_rate = $success_rate,
-            i.created_at = datetime(),
-            i.updated_at = datetime()
-        ON MATCH SET
-            i.type = $type,
-            i.description = $description,
-            i.website = $website,
-            i.founded_year = $founded_year,
-            i.headquarters = $headquarters,
-            i.program_duration = $program_duration,
-            i.batch_size = $batch_size,
-            i.sectors_focus = $sectors_focus,
-            i.equity_taken = $equity_taken,
-            i.funding_provided = $funding_provided,
-            i.portfolio_companies_count = $portfolio_companies_count,
-            i.success_rate = $success_rate,
-            i.updated_at = datetime()
-        RETURN i.id as id
-        """
         try:
-            result = self.connection.execute_query(query, institution_data)
-            return len(result) > 0
+            return self.create_institution_batch([institution_data]) > 0
         except Exception as e:
             logger.error(f"Failed to create institution: {e}")
             return False
     
+    def create_institution_batch(self, rows: List[Dict]) -> int:
+        """Create or update a batch of Institution nodes with a single UNWIND + MERGE (by name), returns rows written"""
+        return self._write_batch(INSTITUTION_BATCH_QUERY, entity_rows('Institution', rows))
+    
     def create_corporate(self, corporate_data: Dict) -> bool:
         """Create a Corporate node (uses MERGE to avoid duplicates by name)"""
-        query = """
-        MERGE (c:Corporate {name: $name})
-        ON CREATE SET 
-            c.id = randomUUID(),
-            c.description = $description,
-            c.website = $website,
-            c.founded_year = $founded_year,
-            c.headquarters = $headquarters,
-            c.sector = $sector,
-            c.size = $size,
-            c.revenue = $revenue,
-            c.employee_count = $employee_count,
-            c.stock_exchange = $stock_exchange,
-            c.ticker = $ticker,
-            c.has_cvc_arm = $has_cvc_arm,
-            c.innovation_programs = $innovation_programs,
-            c.created_at = datetime(),
-            c.updated_at = datetime()
-        ON MATCH SET
-            c.description = $description,
-            c.website = $website,
-            c.industry = $industry,
-            c.founded_year = $founded_year,
-            c.headquarters = $headquarters,
-            c.revenue = $revenue,
-            c.employee_count = $employee_count,
-            c.stock_exchange = $stock_exchange,
-            c.ticker = $ticker,
-            c.has_cvc_arm = $has_cvc_arm,
-            c.innovation_programs = $innovation_programs,
-            c.updated_at = datetime()
-        RETURN c.id as id
-        """
         try:
-            result = self.connection.execute_query(query, corporate_data)
-            return len(result) > 0
+            return self.create_corporate_batch([corporate_data]) > 0
         except Exception as e:
             logger.error(f"Failed to create corporate: {e}")
             return False
     
-    # --- RELATIONSHIP CREATION METHODS ---
+    def create_corporate_batch(self, rows: List[Dict]) -> int:
+        """Create or update a batch of Corporate nodes with a single UNWIND + MERGE (by name), returns rows written"""
+        return self._write_batch(CORPORATE_BATCH_QUERY, entity_rows('Corporate', rows))
     
+    @invalidates_read_cache
     def create_investment_relationship(self, investor_name: str, investor_type: str, 
                                      startup_name: str, investment_data: Dict) -> bool:
         """Create INVESTS_IN relationship (uses MERGE to avoid duplicates by investor+startup)"""
+        investor_type = checked_label(investor_type)
         try:
-            # Create basic relationship first
+            # Only non-null values are applied, so existing properties are never blanked out
+            updates = {key: value for key, value in investment_data.items() if value is not None}
+            if 'round_date' in updates:
+                updates['round_date'] = Date.from_iso_format(str(updates['round_date']))
+            
             query = f"""
             MATCH (investor:{investor_type} {{name: $investor_name}})
             MATCH (startup:Startup {{name: $startup_name}})
             MERGE (investor)-[r:INVESTS_IN]->(startup)
+            SET r += $updates
             RETURN r
             """
             
             params = {
                 'investor_name': investor_name,
-                'startup_name': startup_name
+                'startup_name': startup_name,
+                'updates': updates
             }
             
-            # Execute the basic merge
             result = self.connection.execute_query(query, params)
-            
-            if len(result) > 0:
-                # Now update properties only for non-null values
-                update_parts = []
-                update_params = {
-                    'investor_name': investor_name,
-                    'startup_name': startup_name
-                }
-                
-                for key, value in investment_data.items():
-                    if value is not None:
-                        if key == 'round_date':
-                            update_parts.append(f"r.{key} = date($_{key})")
-                            update_params[f'_{key}'] = str(value)
-                        else:
-                            update_parts.append(f"r.{key} = $_{key}")
-                            update_params[f'_{key}'] = value
-                
-                if update_parts:
-                    update_query = f"""
-                    MATCH (investor:{investor_type} {{name: $investor_name}})
-                    MATCH (startup:Startup {{name: $startup_name}})
-                    MATCH (investor)-[r:INVESTS_IN]->(startup)
-                    SET {', '.join(update_parts)}
-                    RETURN r
-                    """
-                    self.connection.execute_query(update_query, update_params)
-                
-                return True
-            
-            return False
+            return len(result) > 0
             
         except Exception as e:
             logger.error(f"Failed to create investment relationship: {e}")
             return False
     
+    def resolve_node_ids(self, label: str, names: List[str]) -> Dict[str, str]:
+        """Look up the elementId of every named node of a label in one query, returns {name: elementId}"""
+        label = checked_label(label)
+        query = f"""
+        UNWIND $names AS name
+        MATCH (n:{label} {{name: name}})
+        RETURN name, elementId(n) AS id
+        """
+        result = self.connection.execute_query(query, {'names': names})
+        return {record['name']: record['id'] for record in result}
+    
+    @invalidates_read_cache
+    def create_investment_relationships_batch(self, rows: List[Dict]) -> int:
+        """Create INVESTS_IN relationships for a batch of resolved endpoints with a single UNWIND query.
+        
+        Each row holds investor_id, startup_id (elementIds, see resolve_node_ids) and a properties map
+        with only the non-null values, returns the number of relationships written
+        """
+        query = """
+        UNWIND $rows AS row
+        MATCH (investor) WHERE elementId(investor) = row.investor_id
+        MATCH (startup) WHERE elementId(startup) = row.startup_id
+        MERGE (investor)-[r:INVESTS_IN]->(startup)
+        SET r += row.properties
+        RETURN count(r) AS written
+        """
+        result = self.connection.execute_query(query, {'rows': rows})
+        return result[0]['written'] if result else 0
+    
+    @invalidates_read_cache
     def create_angel_investment_relationship(self, person_name: str, startup_name: str, 
                                            investment_data: Dict) -> bool:
         """Create ANGEL_INVESTS_IN relationship (uses MERGE to avoid duplicates by person+startup+date)"""
@@ -429,7 +676,7 @@ class Neo4jRepository:
         MATCH (person:Person {name: $first_name, surname: $last_name})
         MATCH (startup:Startup {name: $startup_name})
         MERGE (person)-[r:ANGEL_INVESTS_IN {
-            investment_date: date($investment_date),
+            investment_date: $investment_date,
             round_stage: $round_stage
         }]->(startup)
         ON CREATE SET
@@ -447,34 +694,37 @@ class Neo4jRepository:
                 'first_name': first_name,
                 'last_name': last_name,
                 'startup_name': startup_name,
-                'investment_date': investment_data['investment_date'].isoformat(),
+                'investment_date': investment_data['investment_date'],
                 'round_stage': investment_data['round_stage'],
                 'amount': investment_data['amount'],
                 'lead_investor': investment_data['lead_investor'],
                 'board_seat': investment_data['board_seat']
             }
+            params = coerce_dates([params], ('investment_date',))[0]
             result = self.connection.execute_query(query, params)
             return len(result) > 0
         except Exception as e:
             logger.error(f"Failed to create angel investment relationship: {e}")
             return False
     
+    @invalidates_read_cache
     def create_employment_relationship(self, person_name: str, org_name: str, 
                                      org_type: str, employment_data: Dict) -> bool:
         """Create WORKS_AT relationship (uses MERGE to avoid duplicates by person+org+role+start_date)"""
+        org_type = checked_label(org_type)
         query = f"""
         MATCH (person:Person {{name: $person_name}})
         MATCH (org:{org_type} {{name: $org_name}})
         MERGE (person)-[r:WORKS_AT {{
             role: $role,
-            start_date: date($start_date)
+            start_date: $start_date
         }}]->(org)
         ON CREATE SET
-            r.end_date = date($end_date),
+            r.end_date = $end_date,
             r.seniority_level = $seniority_level,
             r.is_current = $is_current
         ON MATCH SET
-            r.end_date = date($end_date),
+            r.end_date = $end_date,
             r.seniority_level = $seniority_level,
             r.is_current = $is_current
         RETURN r
@@ -483,16 +733,17 @@ class Neo4jRepository:
             params = {
                 'person_name': person_name,
                 'org_name': org_name,
-                'start_date': str(employment_data['start_date']),
-                'end_date': str(employment_data['end_date']) if employment_data.get('end_date') else None,
+                'end_date': None,
                 **employment_data
             }
+            params = coerce_dates([params], ('start_date', 'end_date'))[0]
             result = self.connection.execute_query(query, params)
             return len(result) > 0
         except Exception as e:
             logger.error(f"Failed to create employment relationship: {e}")
             return False
     
+    @invalidates_read_cache
     def create_fund_management_relationship(self, firm_name: str, fund_name: str, 
                                           management_data: Dict) -> bool:
         """Create MANAGES relationship (uses MERGE to avoid duplicates by firm+fund)"""
@@ -503,20 +754,20 @@ class Neo4jRepository:
         ON CREATE SET
             r.management_fee = $management_fee,
             r.carried_interest = $carried_interest,
-            r.start_date = date($start_date)
+            r.start_date = $start_date
         ON MATCH SET
             r.management_fee = $management_fee,
             r.carried_interest = $carried_interest,
-            r.start_date = date($start_date)
+            r.start_date = $start_date
         RETURN r
         """
         try:
             params = {
                 'firm_name': firm_name,
                 'fund_name': fund_name,
-                'start_date': str(management_data['start_date']),
                 **management_data
             }
+            params = coerce_dates([params], ('start_date',))[0]
             result = self.connection.execute_query(query, params)
             return len(result) > 0
         except Exception as e:
@@ -526,55 +777,41 @@ class Neo4jRepository:
     def create_founded_relationship(self, person_name: str, person_surname: str, startup_name: str, 
                                   founding_data: Dict) -> bool:
         """Create FOUNDED relationship (uses MERGE to avoid duplicates by person+startup)"""
-        first_name = person_name.strip()
-        last_name = person_surname.strip()
-        
-        query = """
-        MATCH (person:Person {name: $first_name, surname: $last_name})
-        MATCH (startup:Startup {name: $startup_name})
-        MERGE (person)-[r:FOUNDED]->(startup)
-        ON CREATE SET
-            r.role = $role,
-            r.founding_date = CASE WHEN $founding_date IS NOT NULL THEN date($founding_date) ELSE null END,
-            r.equity_percentage = $equity_percentage,
-            r.is_current = $is_current,
-            r.exit_date = CASE WHEN $exit_date IS NOT NULL THEN date($exit_date) ELSE null END
-        ON MATCH SET
-            r.role = $role,
-            r.founding_date = CASE WHEN $founding_date IS NOT NULL THEN date($founding_date) ELSE null END,
-            r.equity_percentage = $equity_percentage,
-            r.is_current = $is_current,
-            r.exit_date = CASE WHEN $exit_date IS NOT NULL THEN date($exit_date) ELSE null END
-        RETURN r
-        """
         try:
-            params = {
-                'first_name': first_name,
-                'last_name': last_name,
-                'startup_name': startup_name,
-                'founding_date': str(founding_data['founding_date']) if founding_data.get('founding_date') else None,
-                'exit_date': str(founding_data['exit_date']) if founding_data.get('exit_date') else None,
-                **founding_data
+            row = {
+                **founding_data,
+                'person_name': person_name.strip(),
+                'person_surname': person_surname.strip(),
+                'startup_name': startup_name
             }
-            result = self.connection.execute_query(query, params)
-            return len(result) > 0
+            return self.create_founded_relationships_batch([row]) > 0
         except Exception as e:
             logger.error(f"Failed to create founded relationship: {e}")
             return False
     
+    def create_founded_relationships_batch(self, rows: List[Dict]) -> int:
+        """Create or update a batch of FOUNDED relationships with a single UNWIND + MERGE (by person+startup).
+        
+        Each row holds person_name, person_surname, startup_name and the relationship fields,
+        returns the number of relationships written (rows whose endpoints are missing are skipped)
+        """
+        return self._write_batch(FOUNDED_BATCH_QUERY, coerce_dates(rows, FOUNDED_DATE_FIELDS))
+    
     # --- UTILITY METHODS ---
     
     def get_all_entities_by_type(self, entity_type: str) -> List[Dict]:
         """Get all entities of a specific type"""
+        entity_type = checked_label(entity_type)
         query = f"MATCH (n:{entity_type}) RETURN n.name as name, n.id as id ORDER BY n.name"
         try:
-            return self.connection.execute_query(query)
+            return self._cached_query(query)
         except Exception as e:
             logger.error(f"Failed to get entities of type {entity_type}: {e}")
             return []
     
     def search_entities(self, entity_type: str, search_term: str) -> List[Dict]:
         """Search entities by name"""
+        entity_type = checked_label(entity_type)
         query = f"""
         MATCH (n:{entity_type}) 
         WHERE toLower(n.name) CONTAINS toLower($search_term)
@@ -582,7 +819,7 @@ class Neo4jRepository:
         ORDER BY n.name
         """
         try:
-            return self.connection.execute_query(query, {'search_term': search_term})
+            return self._cached_query(query, {'search_term': search_term})
         except Exception as e:
             logger.error(f"Failed to search {entity_type}: {e}")
             return []
@@ -603,7 +840,7 @@ class Neo4jRepository:
         stats = {}
         for key, query in queries.items():
             try:
-                result = self.connection.execute_query(query)
+                result = self._cached_query(query)
                 stats[key] = result[0]['count'] if result else 0
             except Exception as e:
                 logger.error(f"Failed to get stats for {key}: {e}")
@@ -611,45 +848,30 @@ class Neo4jRepository:
         
         return stats
     
+    @invalidates_read_cache
     def clean_duplicates(self) -> Dict[str, int]:
-        """Remove duplicate nodes and relationships - WARNING: Use with caution!"""
-        cleanup_queries = {
-            'duplicate_persons': """
-                MATCH (n:Person)
-                WITH n.name as name, collect(n) as nodes
-                WHERE size(nodes) > 1
-                UNWIND nodes[1..] as duplicate
-                DETACH DELETE duplicate
-                RETURN count(duplicate) as cleaned
-            """,
-            'duplicate_startups': """
-                MATCH (n:Startup)
-                WITH n.name as name, collect(n) as nodes
-                WHERE size(nodes) > 1
-                UNWIND nodes[1..] as duplicate
-                DETACH DELETE duplicate
-                RETURN count(duplicate) as cleaned
-            """,
-            'duplicate_vc_firms': """
-                MATCH (n:VC_Firm)
-                WITH n.name as name, collect(n) as nodes
-                WHERE size(nodes) > 1
-                UNWIND nodes[1..] as duplicate
-                DETACH DELETE duplicate
-                RETURN count(duplicate) as cleaned
-            """,
-            'duplicate_vc_funds': """
-                MATCH (n:VC_Fund)
-                WITH n.name as name, collect(n) as nodes
-                WHERE size(nodes) > 1
-                UNWIND nodes[1..] as duplicate
-                DETACH DELETE duplicate
-                RETURN count(duplicate) as cleaned
-            """
-        }
+        """Remove duplicate nodes and relationships - WARNING: Use with caution!
         
+        Nodes are duplicates when they share their UNIQUE_KEYS values, the one with the lowest elementId is kept.
+        Nodes are streamed one by one and checked against the key index instead of being grouped with collect(),
+        and deletes are committed in batches (CALL ... IN TRANSACTIONS, Neo4j 5.23+ syntax), so this cannot run
+        inside transaction().
+        """
         results = {}
-        for key, query in cleanup_queries.items():
+        for label, properties in UNIQUE_KEYS.items():
+            key = f"duplicate_{label.lower()}s"
+            same_keys = ', '.join(f"{prop}: duplicate.{prop}" for prop in properties)
+            query = f"""
+                MATCH (duplicate:{label})
+                WHERE EXISTS {{
+                    MATCH (kept:{label} {{{same_keys}}})
+                    WHERE elementId(kept) < elementId(duplicate)
+                }}
+                CALL (duplicate) {{
+                    DETACH DELETE duplicate
+                }} IN TRANSACTIONS OF {DUPLICATE_BATCH_SIZE} ROWS
+                RETURN count(*) as cleaned
+            """
             try:
                 result = self.connection.execute_query(query)
                 results[key] = result[0]['cleaned'] if result else 0
@@ -660,9 +882,11 @@ class Neo4jRepository:
         
         return results
 
+    @invalidates_read_cache
     def create_lp_participation_relationship(self, investor_name: str, investor_type: str, 
                                            fund_name: str, participation_data: Dict) -> bool:
         """Create PARTICIPATED_IN relationship (VC_Fund → VC_Fund or other LP relationships)"""
+        investor_type = checked_label(investor_type)
         # Build dynamic SET clauses for optional fields
         set_clauses = []
         params = {
@@ -672,8 +896,8 @@ class Neo4jRepository:
         
         # Handle commitment_date (can be null)
         if participation_data.get('commitment_date'):
-            set_clauses.append("r.commitment_date = date($commitment_date)")
-            params['commitment_date'] = participation_data['commitment_date'].isoformat()
+            set_clauses.append("r.commitment_date = $commitment_date")
+            params['commitment_date'] = participation_data['commitment_date']
         
         # Handle commitment_amount (can be null)
         if participation_data.get('commitment_amount'):
@@ -697,12 +921,14 @@ class Neo4jRepository:
         RETURN r
         """
         try:
+            params = coerce_dates([params], ('commitment_date',))[0]
             result = self.connection.execute_query(query, params)
             return bool(result)
         except Exception as e:
             logger.error(f"Failed to create LP participation relationship: {e}")
             return False
 
+    @invalidates_read_cache
     def create_acceleration_relationship(self, startup_name: str, institution_name: str, 
                                        acceleration_data: Dict) -> bool:
         """Create ACCELERATED_BY relationship (Startup → Institution)"""
@@ -711,20 +937,20 @@ class Neo4jRepository:
         MATCH (institution:Institution {name: $institution_name})
         MERGE (startup)-[r:ACCELERATED_BY {
             program_name: $program_name,
-            start_date: date($start_date)
+            start_date: $start_date
         }]->(institution)
         ON CREATE SET
             r.batch_name = $batch_name,
-            r.end_date = CASE WHEN $end_date IS NOT NULL THEN date($end_date) ELSE NULL END,
+            r.end_date = $end_date,
             r.equity_taken = $equity_taken,
             r.funding_received = $funding_received,
-            r.demo_day_date = CASE WHEN $demo_day_date IS NOT NULL THEN date($demo_day_date) ELSE NULL END
+            r.demo_day_date = $demo_day_date
         ON MATCH SET
             r.batch_name = $batch_name,
-            r.end_date = CASE WHEN $end_date IS NOT NULL THEN date($end_date) ELSE NULL END,
+            r.end_date = $end_date,
             r.equity_taken = $equity_taken,
             r.funding_received = $funding_received,
-            r.demo_day_date = CASE WHEN $demo_day_date IS NOT NULL THEN date($demo_day_date) ELSE NULL END
+            r.demo_day_date = $demo_day_date
         RETURN r
         """
         try:
@@ -732,19 +958,21 @@ class Neo4jRepository:
                 'startup_name': startup_name,
                 'institution_name': institution_name,
                 'program_name': acceleration_data['program_name'],
-                'start_date': acceleration_data['start_date'].isoformat(),
+                'start_date': acceleration_data['start_date'],
                 'batch_name': acceleration_data.get('batch_name'),
-                'end_date': acceleration_data.get('end_date').isoformat() if acceleration_data.get('end_date') else None,
+                'end_date': acceleration_data.get('end_date') or None,
                 'equity_taken': acceleration_data.get('equity_taken'),
                 'funding_received': acceleration_data.get('funding_received'),
-                'demo_day_date': acceleration_data.get('demo_day_date').isoformat() if acceleration_data.get('demo_day_date') else None
+                'demo_day_date': acceleration_data.get('demo_day_date') or None
             }
+            params = coerce_dates([params], ('start_date', 'end_date', 'demo_day_date'))[0]
             result = self.connection.execute_query(query, params)
             return bool(result)
         except Exception as e:
             logger.error(f"Failed to create acceleration relationship: {e}")
             return False
 
+    @invalidates_read_cache
     def create_acquisition_relationship(self, corporate_name: str, startup_name: str, 
                                       acquisition_data: Dict) -> bool:
         """Create ACQUIRED relationship (Corporate → Startup)"""
@@ -752,7 +980,7 @@ class Neo4jRepository:
         MATCH (corporate:Corporate {name: $corporate_name})
         MATCH (startup:Startup {name: $startup_name})
         MERGE (corporate)-[r:ACQUIRED {
-            acquisition_date: date($acquisition_date)
+            acquisition_date: $acquisition_date
         }]->(startup)
         ON CREATE SET
             r.acquisition_value = $acquisition_value,
@@ -770,27 +998,30 @@ class Neo4jRepository:
             params = {
                 'corporate_name': corporate_name,
                 'startup_name': startup_name,
-                'acquisition_date': acquisition_data['acquisition_date'].isoformat(),
+                'acquisition_date': acquisition_data['acquisition_date'],
                 'acquisition_value': acquisition_data.get('acquisition_value'),
                 'acquisition_type': acquisition_data['acquisition_type'],
                 'strategic_rationale': acquisition_data.get('strategic_rationale'),
                 'integration_status': acquisition_data.get('integration_status')
             }
+            params = coerce_dates([params], ('acquisition_date',))[0]
             result = self.connection.execute_query(query, params)
             return bool(result)
         except Exception as e:
             logger.error(f"Failed to create acquisition relationship: {e}")
             return False
 
+    @invalidates_read_cache
     def create_partnership_relationship(self, corporate_name: str, partner_name: str, partner_type: str,
                                       partnership_data: Dict) -> bool:
         """Create PARTNERS_WITH relationship (Corporate → VC_Firm/Institution)"""
+        partner_type = checked_label(partner_type)
         query = f"""
         MATCH (corporate:Corporate {{name: $corporate_name}})
         MATCH (partner:{partner_type} {{name: $partner_name}})
         MERGE (corporate)-[r:PARTNERS_WITH {{
             partnership_type: $partnership_type,
-            start_date: date($start_date)
+            start_date: $start_date
         }}]->(partner)
         ON CREATE SET
             r.description = $description,
@@ -805,16 +1036,18 @@ class Neo4jRepository:
                 'corporate_name': corporate_name,
                 'partner_name': partner_name,
                 'partnership_type': partnership_data['partnership_type'],
-                'start_date': partnership_data['start_date'].isoformat(),
+                'start_date': partnership_data['start_date'],
                 'description': partnership_data.get('description'),
                 'is_active': partnership_data.get('is_active', True)
             }
+            params = coerce_dates([params], ('start_date',))[0]
             result = self.connection.execute_query(query, params)
             return bool(result)
         except Exception as e:
             logger.error(f"Failed to create partnership relationship: {e}")
             return False
 
+    @invalidates_read_cache
     def create_mentorship_relationship(self, mentor_name: str, mentee_name: str, 
                                      mentorship_data: Dict) -> bool:
         """Create MENTORS relationship (Person → Person)"""
@@ -822,14 +1055,14 @@ class Neo4jRepository:
         MATCH (mentor:Person {name: $mentor_name})
         MATCH (mentee:Person {name: $mentee_name})
         MERGE (mentor)-[r:MENTORS {
-            start_date: date($start_date),
+            start_date: $start_date,
             relationship_type: $relationship_type
         }]->(mentee)
         ON CREATE SET
-            r.end_date = CASE WHEN $end_date IS NOT NULL THEN date($end_date) ELSE NULL END,
+            r.end_date = $end_date,
             r.context = $context
         ON MATCH SET
-            r.end_date = CASE WHEN $end_date IS NOT NULL THEN date($end_date) ELSE NULL END,
+            r.end_date = $end_date,
             r.context = $context
         RETURN r
         """
@@ -837,25 +1070,28 @@ class Neo4jRepository:
             params = {
                 'mentor_name': mentor_name,
                 'mentee_name': mentee_name,
-                'start_date': mentorship_data['start_date'].isoformat(),
+                'start_date': mentorship_data['start_date'],
                 'relationship_type': mentorship_data['relationship_type'],
-                'end_date': mentorship_data.get('end_date').isoformat() if mentorship_data.get('end_date') else None,
+                'end_date': mentorship_data.get('end_date') or None,
                 'context': mentorship_data.get('context')
             }
+            params = coerce_dates([params], ('start_date', 'end_date'))[0]
             result = self.connection.execute_query(query, params)
             return bool(result)
         except Exception as e:
             logger.error(f"Failed to create mentorship relationship: {e}")
             return False
 
+    @invalidates_read_cache
     def create_spinoff_relationship(self, startup_name: str, parent_name: str, parent_type: str,
                                   spinoff_data: Dict) -> bool:
         """Create SPUN_OFF_FROM relationship (Startup → Corporate/Institution)"""
+        parent_type = checked_label(parent_type)
         query = f"""
         MATCH (startup:Startup {{name: $startup_name}})
         MATCH (parent:{parent_type} {{name: $parent_name}})
         MERGE (startup)-[r:SPUN_OFF_FROM {{
-            spinoff_date: date($spinoff_date)
+            spinoff_date: $spinoff_date
         }}]->(parent)
         ON CREATE SET
             r.technology_transferred = $technology_transferred,
@@ -871,11 +1107,12 @@ class Neo4jRepository:
             params = {
                 'startup_name': startup_name,
                 'parent_name': parent_name,
-                'spinoff_date': spinoff_data['spinoff_date'].isoformat(),
+                'spinoff_date': spinoff_data['spinoff_date'],
                 'technology_transferred': spinoff_data.get('technology_transferred'),
                 'initial_equity': spinoff_data.get('initial_equity'),
                 'support_provided': spinoff_data.get('support_provided')
             }
+            params = coerce_dates([params], ('spinoff_date',))[0]
             result = self.connection.execute_query(query, params)
             return bool(result)
         except Exception as e:
@@ -915,6 +1152,7 @@ class Neo4jRepository:
             logger.error(f"Failed to get graph data: {e}")
             return {'nodes': [], 'relationships': []}
     
+    @invalidates_read_cache
     def merge_entities(self, primary_id: str, duplicate_ids: List[str], merge_strategy: str = 'merge_properties') -> bool:
         """
         Merge multiple entities into one, transferring all relationships and properties
@@ -929,7 +1167,7 @@ class Neo4jRepository:
         """
         try:
             # Start transaction
-            with self.connection.driver.session() as session:
+            with self.connection.session_scope() as session:
                 with session.begin_transaction() as tx:
                     
                     # Get primary entity details
@@ -3,8 +3,35 @@
 Analizza la struttura delle sezioni founder/investor su 4books
 """
 
+import re
+
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html
+
+KEYWORD_RE = re.compile(r'team|founder|investor', re.IGNORECASE)
+LINKEDIN_LINK = 'a[contains(@href, "linkedin.com")]'
+
+# Espressioni XPath compilate una volta sola e riusate per ogni link
+ALL_TEXT = etree.XPath('//text()')
+ALL_LINKEDIN_LINKS = etree.XPath(f'//{LINKEDIN_LINK}')
+LINKEDIN_LINKS = etree.XPath(f'.//{LINKEDIN_LINK}')
+COUNT_LINKEDIN_LINKS = etree.XPath(f'count(.//{LINKEDIN_LINK})')
+MULTI_LINKEDIN_DIVS = etree.XPath(f'//div[count(.//{LINKEDIN_LINK}) >= 2]')
+# Il div più vicino (entro 5 livelli) che contiene più di un link LinkedIn, valutato interamente da libxml2
+CONTAINER = etree.XPath(f'ancestor::*[position() <= 5][self::div][count(.//{LINKEDIN_LINK}) > 1][1]')
+# Equivalente di 'div > div > p:nth-child(1)'
+NAME = etree.XPath('descendant::p[parent::div/parent::div][not(preceding-sibling::*)][1]')
+
+def classes(node):
+    return (node.get('class') or '').split()
+
+def text_of(node):
+    return ''.join(part.strip() for part in node.itertext())
+
+def text_parent(text):
+    # Per il testo "tail" getparent() restituisce il fratello precedente, non il contenitore
+    parent = text.getparent()
+    return parent.getparent() if text.is_tail else parent
 
 def analyze_sections():
     url = "https://www.c14.so/2e45ff9b-d40d-431c-ba1c-25824eaa9174"
@@ -12,65 +39,65 @@ def analyze_sections():
     try:
         response = requests.get(url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Decodifica esplicita: senza charset nell'header requests userebbe ISO-8859-1
+        tree = html.fromstring(response.content.decode('utf-8', errors='replace'))
         
         print("=== Analisi Sezioni Founder/Investor ===\n")
         
-        # Cerchiamo elementi che contengono "team" o "founder"
+        # Un solo passaggio sui nodi di testo per "team"/"founder" e "investor"
+        team_elements = []
+        investor_elements = []
+        for text in ALL_TEXT(tree):
+            keywords = {match.lower() for match in KEYWORD_RE.findall(text)}
+            if 'team' in keywords or 'founder' in keywords:
+                team_elements.append(text)
+            if 'investor' in keywords:
+                investor_elements.append(text)
+        
         print("1. Elementi con testo 'team' o 'Meet the team':")
-        team_elements = soup.find_all(text=lambda text: text and ('team' in text.lower() or 'founder' in text.lower()))
         for i, elem in enumerate(team_elements[:5]):
-            parent = elem.parent
+            parent = text_parent(elem)
             print(f"   [{i}] Testo: '{elem.strip()}'")
-            print(f"       Parent: {parent.name} - Classes: {parent.get('class', [])}")
-            print(f"       CSS Path approx: {parent.name}")
+            print(f"       Parent: {parent.tag} - Classes: {classes(parent)}")
+            print(f"       CSS Path approx: {parent.tag}")
             print()
         
-        # Cerchiamo elementi che contengono "investor"  
         print("2. Elementi con testo 'investor' o 'Meet the investors':")
-        investor_elements = soup.find_all(text=lambda text: text and 'investor' in text.lower())
         for i, elem in enumerate(investor_elements[:5]):
-            parent = elem.parent
+            parent = text_parent(elem)
             print(f"   [{i}] Testo: '{elem.strip()}'")
-            print(f"       Parent: {parent.name} - Classes: {parent.get('class', [])}")
+            print(f"       Parent: {parent.tag} - Classes: {classes(parent)}")
             print()
             
         # Analizziamo la struttura intorno ai link LinkedIn
         print("3. Struttura intorno ai link LinkedIn:")
-        linkedin_links = soup.find_all('a', href=lambda href: href and 'linkedin.com' in href)
+        linkedin_links = ALL_LINKEDIN_LINKS(tree)
         for i, link in enumerate(linkedin_links):
-            href = link.get('href', '')
-            text = link.get_text(strip=True)
+            href = link.get('href') or ''
+            text = text_of(link)
             print(f"   [{i}] Link: {href}")
             print(f"       Testo: '{text}'")
             
-            # Troviamo il container padre più vicino
-            container = link
-            for _ in range(5):  # Risali fino a 5 livelli
-                container = container.parent
-                if container and container.name == 'div':
-                    # Controlla se ha fratelli con altri link LinkedIn
-                    siblings = container.find_all('a', href=lambda h: h and 'linkedin.com' in h)
-                    if len(siblings) > 1:
-                        print(f"       Container: {container.get('class', [])} - {len(siblings)} LinkedIn links")
-                        break
+            # Troviamo il container padre più vicino con altri link LinkedIn
+            for container in CONTAINER(link):
+                siblings = int(COUNT_LINKEDIN_LINKS(container))
+                print(f"       Container: {classes(container)} - {siblings} LinkedIn links")
             print()
             
         # Cerchiamo pattern di raggruppamento
         print("4. Analisi pattern di raggruppamento:")
-        divs_with_multiple_linkedin = []
-        for div in soup.find_all('div'):
-            linkedin_in_div = div.find_all('a', href=lambda h: h and 'linkedin.com' in h)
-            if len(linkedin_in_div) >= 2:
-                divs_with_multiple_linkedin.append((div, linkedin_in_div))
+        divs_with_multiple_linkedin = [
+            (div, LINKEDIN_LINKS(div))
+            for div in MULTI_LINKEDIN_DIVS(tree)
+        ]
                 
         for i, (div, links) in enumerate(divs_with_multiple_linkedin[:3]):
             print(f"   Gruppo {i}: {len(links)} LinkedIn links")
-            print(f"   Classes: {div.get('class', [])}")
+            print(f"   Classes: {classes(div)}")
             for link in links:
-                name_elem = link.select_one('div > div > p:nth-child(1)')
-                name = name_elem.get_text(strip=True) if name_elem else "N/A"
-                print(f"     - {name}: {link.get('href', '')}")
+                name_elem = NAME(link)
+                name = text_of(name_elem[0]) if name_elem else "N/A"
+                print(f"     - {name}: {link.get('href') or ''}")
             print()
             
     except Exception as e:
@@ -8,7 +8,6 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.neo4j_repo import Neo4jRepository
-import pandas as pd
 
 def test_person_creation():
     """Test the creation of IFF founders"""
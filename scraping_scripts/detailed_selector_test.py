@@ -4,7 +4,11 @@ Test dettagliato dei selettori CSS per 4books
 """
 
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+
+def children(node, tag):
+    # Equivalente di find_all(tag, recursive=False)
+    return [child for child in node.iter() if child.tag == tag]
 
 def detailed_selector_test():
     url = "https://www.c14.so/2e45ff9b-d40d-431c-ba1c-25824eaa9174"
@@ -12,7 +16,8 @@ def detailed_selector_test():
     try:
         response = requests.get(url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Decodifica esplicita: senza charset nell'header requests userebbe ISO-8859-1
+        tree = LexborHTMLParser(response.content.decode('utf-8', errors='replace'))
         
         print("=== Detailed CSS Selector Test ===")
         
@@ -25,23 +30,23 @@ def detailed_selector_test():
         }
         
         for label, selector in selectors.items():
-            element = soup.select_one(selector)
+            element = tree.css_first(selector)
             if element:
-                result = element.get_text(strip=True)
+                result = element.text(strip=True)
                 print(f"{label}: '{result}' (selector: {selector})")
             else:
                 print(f"{label}: NOT FOUND (selector: {selector})")
                 
         print("\n=== All div.border-default elements with detailed structure ===")
-        border_divs = soup.select('div.border-default')
+        border_divs = tree.css('div.border-default')
         for i, div in enumerate(border_divs, 1):
             print(f"\ndiv.border-default:nth-child({i}):")
-            child_divs = div.find_all('div', recursive=False)
+            child_divs = children(div, 'div')
             for j, child_div in enumerate(child_divs, 1):
-                p_elements = child_div.find_all('p', recursive=False)
+                p_elements = children(child_div, 'p')
                 if len(p_elements) >= 2:
-                    label = p_elements[0].get_text(strip=True)
-                    value = p_elements[1].get_text(strip=True)
+                    label = p_elements[0].text(strip=True)
+                    value = p_elements[1].text(strip=True)
                     print(f"  div:nth-child({j}) > p:nth-child(2): '{value}' (label: '{label}')")
         
     except Exception as e:
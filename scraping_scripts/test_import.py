@@ -38,21 +38,14 @@ def test_founding_relationships_import():
     else:
         print("CSV structure validation passed!")
     
-    # Try to import relationships
+    # Try to import relationships (FOUNDED rows are written in batches)
     print("\nImporting relationships...")
-    success_count = 0
     total_count = len(df)
+    results = importer.import_relationships(df, 'FOUNDED')
+    success_count = results['successful']
     
-    for idx, row in df.iterrows():
-        try:
-            success = importer._create_relationship(row, 'FOUNDED', idx + 1)
-            if success:
-                success_count += 1
-                print(f"✓ Successfully imported relationship {idx + 1}: {row['person_name']} {row['person_surname']} → {row['startup_name']}")
-            else:
-                print(f"✗ Failed to import relationship {idx + 1}: {row['person_name']} {row['person_surname']} → {row['startup_name']}")
-        except Exception as e:
-            print(f"✗ Error importing relationship {idx + 1}: {e}")
+    for error in results['errors']:
+        print(f"✗ {error}")
     
     print(f"\nImport completed: {success_count}/{total_count} relationships imported successfully")
     
@@ -4,7 +4,11 @@ Test script per verificare i selettori CSS sulla pagina di 4books
 """
 
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+
+def children(node, tag):
+    # Equivalente di find_all(tag, recursive=False)
+    return [child for child in node.iter() if child.tag == tag]
 
 def test_selectors():
     url = "https://www.c14.so/2e45ff9b-d40d-431c-ba1c-25824eaa9174"
@@ -12,15 +16,16 @@ def test_selectors():
     try:
         response = requests.get(url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Decodifica esplicita: senza charset nell'header requests userebbe ISO-8859-1
+        tree = LexborHTMLParser(response.content.decode('utf-8', errors='replace'))
         
         print("=== Testing CSS Selectors ===")
         
         # Test current selector
         print("\n1. Current selector: div.border-default:nth-child(1) > div:nth-child(1) > p:nth-child(2)")
-        current_element = soup.select_one('div.border-default:nth-child(1) > div:nth-child(1) > p:nth-child(2)')
+        current_element = tree.css_first('div.border-default:nth-child(1) > div:nth-child(1) > p:nth-child(2)')
         if current_element:
-            print(f"Result: '{current_element.get_text(strip=True)}'")
+            print(f"Result: '{current_element.text(strip=True)}'")
         else:
             print("No result found")
         
@@ -33,33 +38,36 @@ def test_selectors():
         
         for i, selector in enumerate(alternative_selectors, 2):
             print(f"\n{i}. Alternative selector: {selector}")
-            element = soup.select_one(selector)
+            element = tree.css_first(selector)
             if element:
-                print(f"Result: '{element.get_text(strip=True)}'")
+                print(f"Result: '{element.text(strip=True)}'")
             else:
                 print("No result found")
         
         # Search for text containing "11-50"
         print("\n=== Searching for elements containing '11-50' ===")
-        all_elements = soup.find_all(text=lambda text: text and '11-50' in text)
+        all_elements = [
+            node for node in tree.root.traverse(include_text=True)
+            if node.tag == '-text' and '11-50' in node.text_content
+        ]
         for i, text in enumerate(all_elements):
             parent = text.parent
-            print(f"Found '{text.strip()}' in tag: {parent.name} with classes: {parent.get('class', [])}")
+            print(f"Found '{text.text_content.strip()}' in tag: {parent.tag} with classes: {(parent.attributes.get('class') or '').split()}")
             
         # Check all div.border-default elements
         print("\n=== All div.border-default elements ===")
-        border_divs = soup.select('div.border-default')
+        border_divs = tree.css('div.border-default')
         for i, div in enumerate(border_divs):
             print(f"div.border-default:nth-child({i+1}):")
-            print(f"  Content: {div.get_text(strip=True)[:100]}...")
+            print(f"  Content: {div.text(strip=True)[:100]}...")
             # Check child divs
-            child_divs = div.find_all('div', recursive=False)
+            child_divs = children(div, 'div')
             for j, child_div in enumerate(child_divs):
-                print(f"    div:nth-child({j+1}): {child_div.get_text(strip=True)[:50]}...")
+                print(f"    div:nth-child({j+1}): {child_div.text(strip=True)[:50]}...")
                 # Check p elements in child div
-                p_elements = child_div.find_all('p', recursive=False)
+                p_elements = children(child_div, 'p')
                 for k, p in enumerate(p_elements):
-                    print(f"      p:nth-child({k+1}): '{p.get_text(strip=True)}'")
+                    print(f"      p:nth-child({k+1}): '{p.text(strip=True)}'")
             print()
         
     except Exception as e:
@@ -1,3 +1,4 @@
+import asyncio
 import streamlit as st
 import pandas as pd
 from datetime import date, datetime
@@ -357,10 +358,12 @@ def show_analytics():
             # Most connected founders
             query_founders = """
             MATCH (p:Person)-[r:FOUNDED]->(s:Startup)
+            WITH p, count(r) AS startups_founded, collect(s.name) AS startups
+            WHERE startups_founded > 1
             RETURN p.name AS founder_name, 
                    p.surname AS founder_surname,
-                   count(r) AS startups_founded,
-                   collect(s.name) AS startups
+                   startups_founded,
+                   startups
             ORDER BY startups_founded DESC
             LIMIT 10
             """
@@ -368,16 +371,13 @@ def show_analytics():
             try:
                 result = st.session_state.repo.connection.execute_query(query_founders)
                 if result:
-                    df_founders = pd.DataFrame(result)
+                    # The query only returns multi-startup founders
+                    multi_founders = pd.DataFrame(result)
                     st.subheader("🏅 Serial Entrepreneurs")
-                    
-                    # Show only multi-startup founders
-                    multi_founders = df_founders[df_founders['startups_founded'] > 1]
-                    if not multi_founders.empty:
-                        st.dataframe(multi_founders[['founder_name', 'founder_surname', 'startups_founded']], 
-                                   use_container_width=True)
-                    else:
-                        st.info("No serial entrepreneurs found (founders with multiple startups)")
+                    st.dataframe(multi_founders[['founder_name', 'founder_surname', 'startups_founded']], 
+                               use_container_width=True)
+                else:
+                    st.info("No serial entrepreneurs found (founders with multiple startups)")
             except Exception as e:
                 st.error(f"Error loading founder data: {e}")
             
@@ -386,9 +386,11 @@ def show_analytics():
             query_coinvestment = """
             MATCH (i1)-[:INVESTS_IN]->(s:Startup)<-[:INVESTS_IN]-(i2)
             WHERE id(i1) < id(i2)
+            WITH i1, i2, count(s) AS co_investments, collect(s.name)[0..3] AS sample_startups
+            WHERE co_investments > 1
             RETURN i1.name AS investor1, i2.name AS investor2, 
-                   count(s) AS co_investments,
-                   collect(s.name)[0..3] AS sample_startups
+                   co_investments,
+                   sample_startups
             ORDER BY co_investments DESC
             LIMIT 10
             """
@@ -396,13 +398,11 @@ def show_analytics():
             try:
                 result = st.session_state.repo.connection.execute_query(query_coinvestment)
                 if result:
-                    df_coinvest = pd.DataFrame(result)
-                    # Show only pairs with multiple co-investments
-                    frequent_pairs = df_coinvest[df_coinvest['co_investments'] > 1]
-                    if not frequent_pairs.empty:
-                        st.dataframe(frequent_pairs, use_container_width=True)
-                    else:
-                        st.info("No frequent co-investment patterns found")
+                    # The query only returns pairs with multiple co-investments
+                    frequent_pairs = pd.DataFrame(result)
+                    st.dataframe(frequent_pairs, use_container_width=True)
+                else:
+                    st.info("No frequent co-investment patterns found")
             except Exception as e:
                 st.error(f"Error loading co-investment data: {e}")
     
@@ -893,21 +893,23 @@ def show_entity_resolution():
                                         with st.spinner("Deleting entities..."):
                                             try:
                                                 deleted_count = 0
-                                                for entity_name in entities_to_delete:
-                                                    # Find the entity ID
-                                                    entity_idx = entity_options.index(entity_name)
-                                                    entity_id = entity_ids[entity_idx]
-                                                    
-                                                    # Delete the entity
-                                                    delete_query = """
-                                                    MATCH (n) WHERE elementId(n) = $entity_id
-                                                    DETACH DELETE n
-                                                    """
-                                                    
-                                                    st.session_state.repo.connection.execute_query(
-                                                        delete_query, {'entity_id': entity_id}
-                                                    )
-                                                    deleted_count += 1
+                                                # All deletes share one session and commit together
+                                                with st.session_state.repo.batch():
+                                                    for entity_name in entities_to_delete:
+                                                        # Find the entity ID
+                                                        entity_idx = entity_options.index(entity_name)
+                                                        entity_id = entity_ids[entity_idx]
+                                                        
+                                                        # Delete the entity
+                                                        delete_query = """
+                                                        MATCH (n) WHERE elementId(n) = $entity_id
+                                                        DETACH DELETE n
+                                                        """
+                                                        
+                                                        st.session_state.repo.connection.execute_query(
+                                                            delete_query, {'entity_id': entity_id}
+                                                        )
+                                                        deleted_count += 1
                                                 
                                                 st.success(f"✅ Successfully deleted {deleted_count} entities!")
                                                 st.info("🔄 Refresh the page to see updated results")
@@ -2193,6 +2195,15 @@ def show_csv_import():
     with tab3:
         show_import_documentation()
 
+def read_uploaded_csv(uploaded_file):
+    """Parse an uploaded CSV once, reruns triggered by other widgets reuse the DataFrame"""
+    parsed = st.session_state.setdefault('parsed_uploads', {})
+    if uploaded_file.file_id not in parsed:
+        # Only the current upload is kept
+        parsed.clear()
+        parsed[uploaded_file.file_id] = st.session_state.csv_importer.read_csv_file(uploaded_file)
+    return parsed[uploaded_file.file_id]
+
 def show_entity_import():
     """Show entity import interface"""
     st.subheader("📊 Import Entities")
@@ -2213,7 +2224,7 @@ def show_entity_import():
         try:
             # Read CSV with automatic separator detection
             importer = st.session_state.csv_importer
-            df = importer.read_csv_file(uploaded_file)
+            df = read_uploaded_csv(uploaded_file)
             
             # Show preview
             st.subheader("📋 Data Preview")
@@ -2257,7 +2268,7 @@ def show_entity_import():
                     
                     # Perform import
                     with st.spinner(f"Importing {entity_type}s..."):
-                        results = importer.import_entities(df, entity_type)
+                        results = importer.import_entities(df, entity_type, batch_size=int(batch_size))
                     
                     # Show results
                     st.subheader("📊 Import Results")
@@ -2307,7 +2318,7 @@ def show_relationship_import():
         try:
             # Read CSV with automatic separator detection
             importer = st.session_state.csv_importer
-            df = importer.read_csv_file(uploaded_file)
+            df = read_uploaded_csv(uploaded_file)
             
             # Show preview
             st.subheader("📋 Data Preview")
@@ -2548,10 +2559,11 @@ def show_c14_scraper():
                 progress_bar.progress(10)
                 
                 with st.spinner("Scraping in corso... Questo potrebbe richiedere alcuni minuti."):
-                    startups = scraper.scrape_all_startups(
+                    # Detail pages are fetched concurrently while keeping the average delay
+                    startups = asyncio.run(scraper.scrape_all_startups_async(
                         max_pages=max_pages,
                         max_startups=max_startups
-                    )
+                    ))
                 
                 progress_bar.progress(80)
                 status_text.text("Salvataggio dati...")